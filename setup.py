@@ -33,6 +33,7 @@ tests_require = [
     "jinja2==3.1.*",
     "pytest-mock==3.14.*",
     "pytest-benchmark==4.0.0",
+    "pytest-xdist==3.*",
 ]
 
 yubikey_require = [
@@ -80,7 +81,7 @@ kwargs = {
     "entry_points": {
         "console_scripts": [
             "taf = taf.tools.cli.taf:taf",
-            "olc = taf.tools.cli.olc:main",
+            "olc = taf.tools.cli.olc:olc",
         ],
     },
     "classifiers": [
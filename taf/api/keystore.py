@@ -6,7 +6,7 @@ from taf.models.types import RolesKeysData
 from taf.api.utils._conf import find_taf_directory
 
 from taf.api.roles import initialize_roles_and_keystore
-from taf.keys import get_key_name
+from taf.keys import get_key_names
 from taf.log import taf_logger
 from taf.models.types import RolesIterator
 from taf.models.converter import from_dict
@@ -87,8 +87,7 @@ def generate_keys(
     roles_keys_data = from_dict(roles_key_infos_dict, RolesKeysData)
     for role in RolesIterator(roles_keys_data.roles, include_delegations=True):
         if not role.is_yubikey:
-            for key_num in range(role.number):
-                key_name = get_key_name(role.name, key_num, role.number)
+            for key_name in get_key_names(role.name, role.number):
                 if keystore is not None:
                     password = input(
                         f"Enter {key_name} keystore password and press ENTER (can be left empty)"
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from logging import DEBUG, ERROR, INFO
 from typing import Dict, List, Optional, Union
 import os
@@ -15,13 +16,14 @@ from taf.api.roles import (
 from taf.api.utils._conf import read_keys_name_mapping
 from taf.api.utils._git import check_if_clean_and_synced
 from taf.constants import DEFAULT_RSA_SIGNATURE_SCHEME, TARGETS_DIRECTORY_NAME
-from taf.exceptions import TAFError
+from taf.exceptions import RepositoriesNotFoundError, TAFError
 from taf.git import GitRepository
 from taf.messages import git_commit_message
 
 from taf.models.types import Commitish
 import taf.repositoriesdb as repositoriesdb
 from taf.log import taf_logger
+from taf.utils import json_loads
 from taf.auth_repo import AuthenticationRepository
 from taf.yubikey.yubikey_manager import PinManager
 
@@ -89,9 +91,6 @@ def add_target_repo(
     keys_name_mappings = read_keys_name_mapping(keys_description)
     auth_repo.add_key_names(keys_name_mappings)
 
-    if library_dir is None:
-        library_dir = str(auth_repo.path.parent.parent)
-
     if target_path is not None:
         target_repo = GitRepository(path=target_path)
         target_name = target_repo.name
@@ -191,9 +190,18 @@ def _add_target_repository_to_repositories_json(
     if not full_repositories_json_path.parent.is_dir():
         full_repositories_json_path.parent.mkdir()
 
-    Path(auth_repo.path, repositoriesdb.REPOSITORIES_JSON_PATH).write_text(
-        json.dumps(repositories_json, indent=4)
-    )
+    _write_repositories_json(auth_repo, repositories_json)
+
+
+def _write_repositories_json(auth_repo, repositories_json: Dict) -> None:
+    """
+    Write repositories.json of the authentication repository. The content is encoded
+    and written chunk by chunk, so the whole string is never created in memory
+    """
+    with Path(auth_repo.path, repositoriesdb.REPOSITORIES_JSON_PATH).open(
+        "w"
+    ) as repositories_json_file:
+        json.dump(repositories_json, repositories_json_file, indent=4)
 
 
 def export_targets_history(
@@ -242,16 +250,17 @@ def export_targets_history(
     commits_on_branches = auth_repo.sorted_commits_and_branches_per_repositories(
         commits, target_repositories
     )
-    commits_json = json.dumps(commits_on_branches, indent=4)
     if output is not None:
         output_path = Path(output).resolve()
         if output_path.suffix != ".json":
             output_path = output_path.with_suffix(".json")
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(commits_json)
+        # encode and write the history chunk by chunk instead of creating the whole string first
+        with output_path.open("w") as output_file:
+            json.dump(commits_on_branches, output_file, indent=4)
         taf_logger.log("NOTICE", f"Result written to {output_path}")
     else:
-        taf_logger.log("NOTICE", commits_json)
+        taf_logger.log("NOTICE", json.dumps(commits_on_branches, indent=4))
 
 
 def list_targets(
@@ -389,12 +398,14 @@ def register_target_files(
     if removed_targets_data:
         all_updated_targets.extend(list(removed_targets_data.keys()))
 
-    roles_and_targets = defaultdict(list)
+    # map all updated target files to their signing roles at once instead of
+    # traversing delegations for each file separately
+    roles_and_targets = auth_repo.roles_targets_for_filenames(all_updated_targets)
     paths_to_reset: List = []
-    for path in all_updated_targets:
-        roles_and_targets[auth_repo.get_role_from_target_paths([path])].append(path)
-        if reset_updated_targets_on_error:
-            paths_to_reset.append(str(Path(TARGETS_DIRECTORY_NAME, path)))
+    if reset_updated_targets_on_error:
+        paths_to_reset = [
+            str(Path(TARGETS_DIRECTORY_NAME, path)) for path in all_updated_targets
+        ]
 
     _, keystore, _ = initialize_roles_and_keystore(
         roles_key_infos, keystore, enter_info=False
@@ -533,9 +544,7 @@ def _remove_from_repositories_json(auth_repo, target_name):
         else:
             repositories.pop(target_name)
             # update content of repositories.json before updating targets metadata
-            Path(auth_repo.path, repositoriesdb.REPOSITORIES_JSON_PATH).write_text(
-                json.dumps(repositories_json, indent=4)
-            )
+            _write_repositories_json(auth_repo, repositories_json)
             return True
     else:
         taf_logger.log("NOTICE", f"{target_name} not in repositories.json")
@@ -563,6 +572,34 @@ def _save_top_commit_of_repo_to_target(
     _update_target_repos(auth_repo_path, targets_dir, target_repo_path, add_branch)
 
 
+def _save_top_commits_of_repos_to_targets(
+    library_dir: Path,
+    repo_names: List[str],
+    auth_repo_path: Path,
+    add_branch: Optional[bool] = True,
+    jobs: Optional[int] = None,
+) -> None:
+    """
+    Write the top commits of the specified target repositories to their target files.
+    Each repository is handled by a separate worker thread, since determining the top
+    commit and branch is mostly waiting on git and the file system. If jobs is not
+    specified, the number of workers is determined based on the number of CPUs.
+    """
+    if not repo_names:
+        return
+    max_workers = jobs or min(len(repo_names), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # consume the results so that the first exception raised by a worker is propagated
+        list(
+            executor.map(
+                lambda repo_name: _save_top_commit_of_repo_to_target(
+                    library_dir, repo_name, auth_repo_path, add_branch
+                ),
+                repo_names,
+            )
+        )
+
+
 @check_if_clean_and_synced
 @log_on_start(DEBUG, "Updating target files", logger=taf_logger)
 @log_on_end(DEBUG, "Finished updating target files", logger=taf_logger)
@@ -583,6 +620,7 @@ def update_target_repos_from_repositories_json(
     commit: Optional[bool] = True,
     prompt_for_keys: Optional[bool] = False,
     push: Optional[bool] = True,
+    jobs: Optional[int] = None,
 ) -> None:
     """
     Create or update target files by reading the latest commit's repositories.json
@@ -596,6 +634,7 @@ def update_target_repos_from_repositories_json(
         commit (optional): Indicates if the changes should be committed and pushed automatically.
         prompt_for_keys (optional): Whether to ask the user to enter their key if it is not located inside the keystore directory.
         push (optional): Flag specifying whether to push to remote
+        jobs (optional): Number of target repositories processed in parallel. Determined based on the number of CPUs if not provided.
     Side Effects:
        Update target and metadata files and writes changes to disk.
 
@@ -607,13 +646,17 @@ def update_target_repos_from_repositories_json(
         library_dir = str(repo_path.parent.parent)
 
     auth_repo_targets_dir = repo_path / TARGETS_DIRECTORY_NAME
-    repositories_json = json.loads(
-        Path(auth_repo_targets_dir / "repositories.json").read_text()
+    # repositories.json is modified by the API, so it is always read from disk
+    repositories_json = json_loads(
+        Path(auth_repo_targets_dir / "repositories.json").read_bytes()
+    )
+    _save_top_commits_of_repos_to_targets(
+        Path(library_dir),
+        list(repositories_json["repositories"]),
+        repo_path,
+        add_branch,
+        jobs,
     )
-    for repo_name in repositories_json.get("repositories"):
-        _save_top_commit_of_repo_to_target(
-            Path(library_dir), repo_name, repo_path, add_branch
-        )
 
     register_target_files(
         repo_path,
@@ -650,6 +693,7 @@ def update_and_sign_targets(
     commit: Optional[bool] = True,
     prompt_for_keys: Optional[bool] = False,
     push: Optional[bool] = True,
+    jobs: Optional[int] = None,
 ) -> None:
     """
     Save the top commit of specified target repositories to the corresponding target files and sign.
@@ -663,6 +707,7 @@ def update_and_sign_targets(
         scheme (optional): Signing scheme. Set to rsa-pkcs1v15-sha256 by default.
         commit (optional): Indicates if the changes should be committed and pushed automatically.
         prompt_for_keys (optional): Whether to ask the user to enter their key if it is not located inside the keystore directory.
+        jobs (optional): Number of target repositories processed in parallel. Determined based on the number of CPUs if not provided.
 
     Side Effects:
        Update target and metadata files and writes changes to disk.
@@ -678,20 +723,32 @@ def update_and_sign_targets(
     if library_dir is None:
         library_dir = str(repo_path.parent.parent)  # Ensure this uses the Path object
     repositoriesdb.load_repositories(auth_repo)
-    nonexistent_target_types = []
-    target_names = []
-    for target_type in target_types:
-        try:
-            targets = repositoriesdb.get_repositories_paths_by_custom_data(
-                auth_repo, type=target_type
-            )
-            if targets is not None:
-                target_names.append(targets[0])
-            else:
-                nonexistent_target_types.append(target_type)
-        except Exception:
-            nonexistent_target_types.append(target_type)
-            continue
+    try:
+        repositories = repositoriesdb.get_repositories(auth_repo)
+    except RepositoriesNotFoundError:
+        repositories = {}
+    # find the first repository of each of the specified types in a single pass
+    # over the loaded repositories
+    types_to_find = frozenset(target_types)
+    names_by_type: Dict[str, str] = {}
+    for repo_name, repo in repositories.items():
+        repo_type = repo.custom.get("type")
+        if (
+            isinstance(repo_type, str)
+            and repo_type in types_to_find
+            and repo_type not in names_by_type
+        ):
+            names_by_type[repo_type] = repo_name
+    nonexistent_target_types = [
+        target_type for target_type in target_types if target_type not in names_by_type
+    ]
+    target_names = list(
+        dict.fromkeys(
+            names_by_type[target_type]
+            for target_type in target_types
+            if target_type in names_by_type
+        )
+    )
     if len(nonexistent_target_types):
         taf_logger.error(
             f"Target types {'.'.join(nonexistent_target_types)} not in repositories.json. Targets not updated"
@@ -699,10 +756,10 @@ def update_and_sign_targets(
         return
 
     # only update target files if all specified types are valid
+    _save_top_commits_of_repos_to_targets(
+        Path(library_dir), target_names, repo_path, True, jobs
+    )
     for target_name in target_names:
-        _save_top_commit_of_repo_to_target(
-            Path(library_dir), target_name, repo_path, True
-        )
         taf_logger.log("NOTICE", f"Updated {target_name} target file")
 
     register_target_files(
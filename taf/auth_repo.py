@@ -17,6 +17,7 @@ from taf.tuf.repository import (
     get_target_path,
 )
 from taf.constants import INFO_JSON_PATH, KEYS_MAPPING_PATH
+from taf.utils import json_loads
 from taf.yubikey.yubikey_manager import PinManager
 
 
@@ -627,6 +628,5 @@ class AuthenticationRepository(GitRepository):
         """
         repositories_path = self.targets_path / "repositories.json"
         if repositories_path.exists():
-            repositories = repositories_path.read_text()
-            repositories = json.loads(repositories)["repositories"]
+            repositories = json_loads(repositories_path.read_bytes())["repositories"]
             return [str(Path(target_path).as_posix()) for target_path in repositories]
@@ -30,7 +30,7 @@ from taf.exceptions import (
     PygitError,
 )
 from taf.log import NOTICE, taf_logger
-from taf.utils import run
+from taf.utils import json_loads, run
 from typing import Callable, Dict, List, Optional, Tuple, Union
 from .pygit import PyGitRepository
 
@@ -1077,7 +1077,7 @@ class GitRepository:
     ) -> Optional[Dict]:
         s = self.get_file(commit, path, raw=raw)
         if s and isinstance(s, str):
-            return json.loads(s)
+            return json_loads(s)
         return None
 
     def get_file(
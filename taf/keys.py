@@ -1,8 +1,13 @@
-from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from logging import INFO
+import os
+import shutil
+import stat
 from typing import Dict, List, Optional, Tuple, Union
 import click
 from pathlib import Path
+from cryptography import x509
 from logdecorator import log_on_start
 from taf.auth_repo import AuthenticationRepository
 from taf.log import taf_logger
@@ -43,6 +48,9 @@ except ImportError:
     )
     yk = YubikeyMissingLibrary()  # type: ignore
 
+# PEM encoded certificates are a few KB at most
+MAX_CERT_SIZE = 64 * 1024
+
 
 def _create_signer(auth_repo, public_key, serial_num, key_name):
     return YkSigner(
@@ -65,8 +73,17 @@ def get_key_name(role_name: str, key_num: int, num_of_keys: int) -> str:
     """
     if num_of_keys == 1:
         return role_name
-    else:
-        return role_name + str(key_num + 1)
+    return f"{role_name}{key_num + 1}"
+
+
+def get_key_names(role_name: str, num_of_keys: int) -> List[str]:
+    """
+    Return names of all keystore keys of a role with the given number of signing keys
+    (see get_key_name)
+    """
+    if num_of_keys == 1:
+        return [role_name]
+    return [f"{role_name}{key_num}" for key_num in range(1, num_of_keys + 1)]
 
 
 def get_metadata_key_info(certs_dir: str, key_id: str) -> TAFKey:
@@ -75,31 +92,50 @@ def get_metadata_key_info(certs_dir: str, key_id: str) -> TAFKey:
     file whose name matches that key's id.
     """
     cert_path = Path(certs_dir, key_id + ".cert")
-    if cert_path.is_file():
-        cert_pem = cert_path.read_bytes()
-        return TAFKey(key_id, **_extract_x509(cert_pem))
+    try:
+        cert_stat = cert_path.stat()
+    except OSError:
+        return TAFKey(key_id)
+    # skip anything that cannot be a PEM certificate without parsing it
+    if (
+        not stat.S_ISREG(cert_stat.st_mode)
+        or cert_stat.st_size == 0
+        or cert_stat.st_size > MAX_CERT_SIZE
+    ):
+        return TAFKey(key_id)
+
+    cert_info = _load_cert_info(
+        str(cert_path), cert_stat.st_mtime_ns, cert_stat.st_size
+    )
+    return TAFKey(key_id, **cert_info)
 
-    return TAFKey(key_id)
 
+@lru_cache(maxsize=256)
+def _load_cert_info(cert_path: str, mtime_ns: int, size: int) -> Dict:
+    """
+    Parse the certificate at the given path. Modification time and size are
+    only a part of the cache key, so that a modified certificate is parsed again.
+    """
+    return _extract_x509(Path(cert_path).read_bytes())
 
-def _extract_x509(cert_pem: bytes) -> Dict:
-    from cryptography import x509
-    from cryptography.hazmat.backends import default_backend
 
-    cert = x509.load_pem_x509_certificate(cert_pem, default_backend())
+def _extract_x509(cert_pem: bytes) -> Dict:
+    cert = x509.load_pem_x509_certificate(cert_pem)
 
-    def _get_attr(oid):
-        attrs = cert.subject.get_attributes_for_oid(oid)
-        return attrs[0].value if len(attrs) > 0 else ""
+    # collect all subject attributes in a single pass, keeping the first value
+    # of each oid (matching get_attributes_for_oid(oid)[0])
+    attrs: Dict = {}
+    for attr in cert.subject:
+        attrs.setdefault(attr.oid, attr.value)
 
     return {
-        "name": _get_attr(x509.OID_COMMON_NAME),
-        "organization": _get_attr(x509.OID_ORGANIZATION_NAME),
-        "country": _get_attr(x509.OID_COUNTRY_NAME),
-        "state": _get_attr(x509.OID_STATE_OR_PROVINCE_NAME),
-        "locality": _get_attr(x509.OID_LOCALITY_NAME),
-        "valid_from": cert.not_valid_before.strftime("%Y-%m-%d"),
-        "valid_to": cert.not_valid_after.strftime("%Y-%m-%d"),
+        "name": attrs.get(x509.OID_COMMON_NAME, ""),
+        "organization": attrs.get(x509.OID_ORGANIZATION_NAME, ""),
+        "country": attrs.get(x509.OID_COUNTRY_NAME, ""),
+        "state": attrs.get(x509.OID_STATE_OR_PROVINCE_NAME, ""),
+        "locality": attrs.get(x509.OID_LOCALITY_NAME, ""),
+        "valid_from": cert.not_valid_before_utc.date().isoformat(),
+        "valid_to": cert.not_valid_after_utc.date().isoformat(),
     }
 
 
@@ -136,10 +172,12 @@ def load_sorted_keys_of_new_roles(
         Signing and verification keys of roles
     """
 
-    def _sort_roles(roles):
+    def _sort_roles(roles, existing):
         keystore_roles = []
         yubikey_roles = []
         for role in RolesIterator(roles):
+            if role.name in existing:
+                continue
             if role.is_yubikey:
                 yubikey_roles.append(role)
             else:
@@ -147,59 +185,99 @@ def load_sorted_keys_of_new_roles(
         return keystore_roles, yubikey_roles
 
     # load and/or generate all keys first
-    if existing_roles is None:
-        existing_roles = []
+    existing = set(existing_roles) if existing_roles else set()
     try:
-        keystore_roles, yubikey_roles = _sort_roles(roles)
+        keystore_roles, yubikey_roles = _sort_roles(roles, existing)
         signers: Dict = {}
         verification_keys: Dict = {}
 
-        for role in keystore_roles:
-            if role.name in existing_roles:
-                continue
-            keystore_signers, _, _ = setup_roles_keys(
-                role,
-                auth_repo,
-                keystore=keystore,
-                skip_prompt=skip_prompt,
-            )
-            for signer in keystore_signers:
-                signers.setdefault(role.name, []).append(signer)
+        def _setup_keystore_roles():
+            for role in keystore_roles:
+                keystore_signers, _, _ = setup_roles_keys(
+                    role,
+                    auth_repo,
+                    keystore=keystore,
+                    skip_prompt=skip_prompt,
+                )
+                for signer in keystore_signers:
+                    signers.setdefault(role.name, []).append(signer)
+
+        def _setup_yubikey_roles():
+            for role in yubikey_roles:
+                _, yubikey_keys, yubikey_signers = setup_roles_keys(
+                    role,
+                    auth_repo,
+                    certs_dir=certs_dir,
+                    users_yubikeys_details=yubikeys_data,
+                    skip_prompt=skip_prompt,
+                )
+                verification_keys[role.name] = yubikey_keys
+                signers[role.name] = yubikey_signers
 
-        for role in yubikey_roles:
-            if role.name in existing_roles:
-                continue
-            _, yubikey_keys, yubikey_signers = setup_roles_keys(
-                role,
-                auth_repo,
-                certs_dir=certs_dir,
-                users_yubikeys_details=yubikeys_data,
-                skip_prompt=skip_prompt,
-            )
-            verification_keys[role.name] = yubikey_keys
-            signers[role.name] = yubikey_signers
+        if keystore is not None and _can_generate_keys_in_background(
+            keystore_roles, yubikey_roles, keystore, skip_prompt
+        ):
+            # setting up YubiKeys is interactive, so generate keystore keys while
+            # the user is doing that. Key names are registered in this thread
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                keystore_futures = [
+                    (
+                        role,
+                        executor.submit(
+                            _setup_keystore_role_keys, role, keystore, skip_prompt
+                        ),
+                    )
+                    for role in keystore_roles
+                ]
+                _setup_yubikey_roles()
+                for role, future in keystore_futures:
+                    for key_name, signer, key_id in future.result():
+                        signers.setdefault(role.name, []).append(signer)
+                        auth_repo.add_key_name(key_name, key_id)
+        else:
+            _setup_keystore_roles()
+            _setup_yubikey_roles()
 
         return signers, verification_keys
     except KeystoreError:
         raise SigningError("Could not load keys of new roles")
 
 
+def _can_generate_keys_in_background(
+    keystore_roles: List[Role],
+    yubikey_roles: List[Role],
+    keystore: Union[Path, str],
+    skip_prompt: Optional[bool],
+) -> bool:
+    """
+    Keystore keys can be set up without any user input if prompts are skipped
+    and none of the keys exist yet (loading an existing key might require a password)
+    """
+    if not skip_prompt or not keystore_roles or not yubikey_roles:
+        return False
+    keystore_path = Path(keystore).expanduser().resolve()
+    return not any(
+        (keystore_path / key_name).is_file()
+        for role in keystore_roles
+        for key_name in get_key_names(role.name, role.number)
+    )
+
+
 def _load_signer_from_keystore(
-    taf_repo, keystore_path, key_name, num_of_signatures, scheme, role
-) -> CryptoSigner:
+    keystore_path, key_name, scheme, valid_keyids
+) -> Optional[CryptoSigner]:
     if keystore_path is None:
         return None
-    if (keystore_path / key_name).is_file():
-        try:
-            signer = load_signer_from_private_keystore(
-                keystore=keystore_path, key_name=key_name, scheme=scheme
-            )
-            # load only valid keys
-            if taf_repo.is_valid_metadata_key(role, signer.public_key, scheme=scheme):
-                return signer
-        except KeystoreError:
-            pass
-
+    # load_signer_from_private_keystore raises an error if the file does not exist
+    try:
+        signer = load_signer_from_private_keystore(
+            keystore=keystore_path, key_name=key_name, scheme=scheme
+        )
+    except KeystoreError:
+        return None
+    # load only valid keys
+    if _get_legacy_keyid(signer.public_key) in valid_keyids:
+        return signer
     return None
 
 
@@ -247,16 +325,7 @@ def _load_yubikeys(
             taf_logger.debug(
                 f"Found YubiKey: Serial={serial_num}, key_name='{key_name}', keyid={public_key.keyid}"
             )
-            signer = YkSigner(
-                public_key,
-                serial_num,
-                partial(
-                    yk.yk_secrets_handler,
-                    pin_manager=taf_repo.pin_manager,
-                    serial_num=serial_num,
-                ),
-                key_name=key_name,
-            )
+            signer = _create_signer(taf_repo, public_key, serial_num, key_name)
             signers_yubikeys.append(signer)
             loaded_keyids.append(public_key.keyid)
             loaded_key_names.append(key_name)
@@ -304,6 +373,9 @@ def load_signers(
     keystore_files = []
     if keystore is not None:
         keystore_files = get_keystore_keys_of_role(keystore, role)
+    num_of_keystore_files = len(keystore_files)
+    valid_keyids = set(taf_repo.get_keyids_of_role(role))
+    auto_continue = taf_repo.pin_manager.auto_continue
     prompt_for_yubikey = True
 
     taf_repo.add_default_names_of_role(role)
@@ -315,17 +387,17 @@ def load_signers(
 
         # when loading from keystore files
         # there is no need to ask the user if they want to load more key, try to load from keystore
-        if num_of_signatures < len(keystore_files):
+        if num_of_signatures < num_of_keystore_files:
             key_name = keystore_files[num_of_signatures]
             signer = _load_signer_from_keystore(
-                taf_repo, keystore_path, key_name, num_of_signatures, scheme, role
+                keystore_path, key_name, scheme, valid_keyids
             )
             if signer is not None:
                 signers_keystore.append(signer)
                 num_of_signatures += 1
                 continue
         if num_of_signatures >= threshold:
-            if use_yubikeys_to_sign and not taf_repo.pin_manager.auto_continue:
+            if use_yubikeys_to_sign and not auto_continue:
                 if not secret_yes_no_prompt(
                     f"Threshold of {role} keys reached. "
                     f"Do you want to load more {role} keys? [y/N]"
@@ -355,8 +427,12 @@ def load_signers(
             if loaded_keys:
                 use_yubikeys_to_sign = True
                 num_of_loaded_keys = len(loaded_keys)
-                for loaded_key in loaded_keys:
-                    key_names.remove(loaded_key)
+                loaded_key_names = set(loaded_keys)
+                key_names = [
+                    key_name
+                    for key_name in key_names
+                    if key_name not in loaded_key_names
+                ]
 
                 if num_of_loaded_keys:
                     num_of_signatures += num_of_loaded_keys
@@ -430,24 +506,75 @@ def setup_roles_keys(
         if keystore is None:
             taf_logger.error("No keystore provided and no default keystore found")
             raise KeyError("No keystore provided and no default keystore found")
-        default_params = RoleSetupParams()
-        for key_num in range(role.number):
-            key_name = get_key_name(role.name, key_num, role.number)
-            signer, key_id = _setup_keystore_key(
-                keystore,
-                role.name,
-                key_name,
-                role.scheme or default_params["scheme"],
-                role.length or default_params["length"],
-                None,
-                skip_prompt=skip_prompt,
-            )
+        for key_name, signer, key_id in _setup_keystore_role_keys(
+            role, keystore, skip_prompt
+        ):
             keystore_signers.append(signer)
             auth_repo.add_key_name(key_name, key_id)
 
     return keystore_signers, yubikey_keys, yubikey_signers
 
 
+def _setup_keystore_role_keys(
+    role: Role,
+    keystore: Union[Path, str],
+    skip_prompt: Optional[bool],
+) -> List[Tuple[str, CryptoSigner, str]]:
+    """
+    Load or generate keystore keys of the specified role. Return a list of
+    key names, signers and key ids. Key names are not registered, that is
+    left to the caller.
+    """
+    default_params = RoleSetupParams()
+    scheme = role.scheme or default_params["scheme"]
+    length = role.length or default_params["length"]
+    key_names = get_key_names(role.name, role.number)
+
+    def _setup_key(key_name):
+        return _setup_keystore_key(
+            keystore,
+            role.name,
+            key_name,
+            scheme,
+            length,
+            None,
+            skip_prompt=skip_prompt,
+        )
+
+    # if prompts are skipped, keys which are not in the keystore are generated
+    # without any user input or output, so they can be generated concurrently
+    # (cryptography releases the GIL during RSA key generation)
+    # loading existing keys might require entering a password
+    generated_keys = {}
+    keys_to_generate = []
+    if skip_prompt:
+        keystore_path = Path(keystore).expanduser().resolve()
+        keys_to_generate = [
+            key_name
+            for key_name in key_names
+            if not (keystore_path / key_name).is_file()
+        ]
+
+        def _generate_key(key_name):
+            return _generate_keystore_key(keystore_path, key_name, length)
+
+        if keys_to_generate:
+            max_workers = min(len(keys_to_generate), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                generated_keys = dict(
+                    zip(keys_to_generate, executor.map(_generate_key, keys_to_generate))
+                )
+
+    role_keys = []
+    for key_name in key_names:
+        if key_name in generated_keys:
+            signer, key_id = generated_keys[key_name]
+        else:
+            signer, key_id = _setup_key(key_name)
+        role_keys.append((key_name, signer, key_id))
+    return role_keys
+
+
 def _setup_yubikey_roles_keys(
     auth_repo, yubikey_ids, users_yubikeys_details, role, certs_dir, key_size
 ):
@@ -459,28 +586,36 @@ def _setup_yubikey_roles_keys(
     # if a key was already loaded (while setting up a different role)
     # register signers and remove the key id, so that the user is not asked to enter it again
     yubikes_to_skip = []
+    yubikeys_data = auth_repo.yubikey_store.yubikeys_data
     names_defined = bool(yubikey_ids)
     if names_defined:
-        for key_name in list(yubikey_ids):
-            key_data = auth_repo.yubikey_store.get_key_data(key_name)
-            if key_data is not None:
-                public_key, serial_num = key_data
-                auth_repo.yubikey_store.add_key_data(
-                    key_name, serial_num, public_key, role.name
-                )
-                yubikey_ids.remove(key_name)
-                yubikey_keys.append(public_key)
-                loaded_keys_num += 1
-                signer = _create_signer(auth_repo, public_key, serial_num, key_name)
-                signers.append(signer)
+        remaining_yubikey_ids = []
+        for key_name in yubikey_ids:
+            key_data = yubikeys_data.get(key_name)
+            if key_data is None:
+                remaining_yubikey_ids.append(key_name)
+                continue
+            public_key, serial_num = key_data["public_key"], key_data["serial"]
+            auth_repo.yubikey_store.add_key_data(
+                key_name, serial_num, public_key, role.name
+            )
+            yubikey_keys.append(public_key)
+            loaded_keys_num += 1
+            signer = _create_signer(auth_repo, public_key, serial_num, key_name)
+            signers.append(signer)
+        # update the list in place, it is the role's list of yubikeys
+        yubikey_ids[:] = remaining_yubikey_ids
 
         # if key already loaded while setting up a different role, skip it
         # if the current role's yubikey ids are defined
         # however, if the current role's yubikey ids are not specified
         # it can be possible to reuse a yubikey
-        for key_name, key_data in auth_repo.yubikey_store.yubikeys_data.items():
-            if key_name not in yubikey_ids:
-                yubikes_to_skip.append(key_data["serial"])
+        yubikey_ids_set = set(yubikey_ids)
+        yubikes_to_skip = [
+            key_data["serial"]
+            for key_name, key_data in yubikeys_data.items()
+            if key_name not in yubikey_ids_set
+        ]
     else:
         yubikey_ids = [f"{role.name}{counter}" for counter in range(1, role.number + 1)]
 
@@ -492,10 +627,10 @@ def _setup_yubikey_roles_keys(
             scheme = users_yubikeys_details[key_name].scheme
             public_key = get_sslib_key_from_value(public_key_text, scheme)
             # Check if the signing key is already loaded
-            if not auth_repo.yubikey_store.is_key_name_loaded(key_name):
+            if key_name not in yubikeys_data:
                 yk_with_public_key[key_name] = public_key
             else:
-                serial_num = auth_repo.yubikey_store.get_key_data["serial"]
+                serial_num = yubikeys_data[key_name]["serial"]
                 auth_repo.yubikey_store.add_key_data(
                     key_name, serial_num, public_key, role.name
                 )
@@ -544,6 +679,21 @@ def _setup_yubikey_roles_keys(
     return yubikey_keys, signers
 
 
+def _generate_keystore_key(
+    keystore_path: Path, key_name: str, length: int
+) -> Tuple[CryptoSigner, str]:
+    """
+    Generate a new key and write it to the keystore without a password. Unlike
+    _setup_keystore_key, this does not try to load the key first and does not
+    print anything, so it can be called from a background thread
+    """
+    private_pem = generate_and_write_rsa_keypair(
+        path=keystore_path / key_name, key_size=length, password=None
+    )
+    signer = load_signer_from_pem(private_pem)
+    return signer, _get_legacy_keyid(signer.public_key)
+
+
 def _setup_keystore_key(
     keystore: Optional[Union[Path, str]],
     role_name: str,
@@ -556,25 +706,25 @@ def _setup_keystore_key(
     generate_new_keys = keystore is None
     signer = None
 
-    def _invalid_key_message(key_name, keystore):
-        key_path = Path(keystore, key_name)
+    def _invalid_key_message(key_path):
         if key_path.is_file():
             print(f"Could not load private key {key_path}")
         else:
             print(f"{key_path} is not a file!")
 
     if keystore is not None:
-        keystore_path = str(Path(keystore).expanduser().resolve())
+        keystore_path = Path(keystore).expanduser().resolve()
+        key_path = keystore_path / key_name
         while signer is None:
             try:
                 signer = load_signer_from_private_keystore(
-                    keystore_path,
+                    str(keystore_path),
                     key_name,
                     scheme=scheme,
                     password=password,
                 )
             except KeystoreError:
-                _invalid_key_message(key_name, keystore)
+                _invalid_key_message(key_path)
 
             if signer is None:
                 generate_new_keys = skip_prompt is True or click.confirm(
@@ -585,12 +735,9 @@ def _setup_keystore_key(
                         reused_key_name = input(
                             "Enter name of an existing keystore file: "
                         )
-                        Path(keystore, key_name).write_bytes(
-                            Path(keystore, reused_key_name).read_bytes()
-                        )
-                        Path(keystore, key_name + ".pub").write_bytes(
-                            Path(keystore, reused_key_name + ".pub").read_bytes()
-                        )
+                        reused_key_path = keystore_path / reused_key_name
+                        shutil.copyfile(reused_key_path, key_path)
+                        shutil.copyfile(f"{reused_key_path}.pub", f"{key_path}.pub")
                     else:
                         raise KeystoreError(f"Could not load {key_name}")
                 else:
@@ -604,7 +751,7 @@ def _setup_keystore_key(
                     "Enter keystore password and press ENTER (can be left empty)"
                 )
             private_pem = generate_and_write_rsa_keypair(
-                path=Path(keystore, key_name), key_size=length, password=password
+                path=key_path, key_size=length, password=password
             )
             signer = load_signer_from_pem(private_pem)
         else:
@@ -689,6 +836,7 @@ def _load_remaining_keys_of_role(
     )
     while loaded_keys_num < role.threshold:
         loaded_keys = []
+        loaded_keyids = set()
         for key_name, public_key in yk_with_public_key.items():
             serial_num = _load_and_verify_yubikey(
                 role.name,
@@ -701,7 +849,12 @@ def _load_remaining_keys_of_role(
                 loaded_keys.append(key_name)
                 signer = _create_signer(auth_repo, public_key, serial_num, key_name)
                 signers.append(signer)
-                yubikey_keys.remove(signer.public_key)
+                loaded_keyids.add(public_key.keyid)
+
+        if loaded_keyids:
+            yubikey_keys[:] = [
+                key for key in yubikey_keys if key.keyid not in loaded_keyids
+            ]
 
         if loaded_keys_num < role.threshold:
             if not click.confirm(
@@ -1,20 +1,32 @@
 from taf.yubikey.yubikey_manager import PinManager
 import pytest
 import json
+import os
 import re
 import shutil
+import tempfile
+import uuid
 from pathlib import Path
 
 from taf.tuf.keys import load_signer_from_file
 
 # from taf.tests import TEST_WITH_REAL_YK
-from taf.utils import on_rm_error
+from taf.utils import remove_directory
 
 TEST_DATA_PATH = Path(__file__).parent / "data"
-TEST_DATA_REPOS_PATH = TEST_DATA_PATH / "repos"
+# when tests are run in parallel using pytest-xdist (pytest -n auto --dist loadfile),
+# each worker creates and removes repositories and outputs inside of its own directory
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "")
+TEST_DATA_REPOS_PATH = TEST_DATA_PATH / "repos" / XDIST_WORKER
 TEST_DATA_ORIGIN_PATH = TEST_DATA_REPOS_PATH / "origin"
-TEST_OUTPUT_PATH = TEST_DATA_PATH / "output"
+TEST_OUTPUT_PATH = TEST_DATA_PATH / "output" / XDIST_WORKER
 KEYSTORES_PATH = TEST_DATA_PATH / "keystores"
+TEST_TMP_PATH = Path(
+    os.environ.get(
+        "TAF_TEST_TMP",
+        "/dev/shm" if Path("/dev/shm").is_dir() else tempfile.gettempdir(),
+    )
+)
 KEYSTORE_PATH = KEYSTORES_PATH / "keystore"
 WRONG_KEYSTORE_PATH = KEYSTORES_PATH / "wrong_keystore"
 DELEGATED_ROLES_KEYSTORE_PATH = KEYSTORES_PATH / "delegated_roles_keystore"
@@ -30,14 +42,31 @@ REPOSITORIES_JSON_PATH = TEST_INIT_DATA_PATH / "repositories.json"
 MIRRORS_JSON_PATH = TEST_INIT_DATA_PATH / "mirrors.json"
 
 
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    # tests spawn git processes, so leave a couple of cores for them when using -n auto
+    return max(1, (os.cpu_count() or 1) - 2)
+
+
 @pytest.fixture(scope="session", autouse=True)
-def repo_dir():
+def client_dir_path():
     path = CLIENT_DIR_PATH
     if path.is_dir():
-        shutil.rmtree(path, onerror=on_rm_error)
+        remove_directory(path)
+    path.mkdir(parents=True)
+    yield path
+    remove_directory(path)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def repo_dir():
+    # tests create and remove a lot of git repositories, so store them in memory
+    # when possible and remove them all at the end of the session instead of
+    # after each test
+    path = TEST_TMP_PATH / f"taf-{uuid.uuid4()}"
     path.mkdir(parents=True)
     yield path
-    shutil.rmtree(path, onerror=on_rm_error)
+    remove_directory(path)
 
 
 @pytest.fixture(scope="session")
@@ -129,15 +158,15 @@ def repo_path(request, repo_dir):
     full_path.mkdir(parents=True)
 
     yield full_path
-    shutil.rmtree(full_path, onerror=on_rm_error)
+    remove_directory(full_path)
 
 
 @pytest.fixture(scope="session", autouse=True)
 def output_path():
     shutil.rmtree(TEST_OUTPUT_PATH, ignore_errors=True)
-    TEST_OUTPUT_PATH.mkdir()
+    TEST_OUTPUT_PATH.mkdir(parents=True)
     yield TEST_OUTPUT_PATH
-    shutil.rmtree(TEST_OUTPUT_PATH, onerror=on_rm_error)
+    remove_directory(TEST_OUTPUT_PATH)
 
 
 @pytest.fixture(scope="session")
@@ -1,5 +1,7 @@
+import os
 import shutil
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict
 
@@ -8,11 +10,18 @@ from _pytest.logging import LogCaptureFixture
 from loguru import logger
 
 from taf.api.repository import create_repository
+from taf.api.targets import register_target_files
 from taf.auth_repo import AuthenticationRepository
+from taf.constants import TARGETS_DIRECTORY_NAME
 from taf.git import GitRepository
-from taf.tests.conftest import CLIENT_DIR_PATH, KEYSTORES_PATH, TEST_DATA_PATH
+from taf.tests.conftest import (
+    CLIENT_DIR_PATH,
+    KEYSTORES_PATH,
+    TEST_DATA_PATH,
+    XDIST_WORKER,
+)
 from taf.tests.utils import copy_mirrors_json, copy_repositories_json, read_json
-from taf.utils import on_rm_error
+from taf.utils import remove_directory
 from taf.yubikey.yubikey_manager import PinManager
 
 REPOSITORY_DESCRIPTION_INPUT_DIR = TEST_DATA_PATH / "repository_description_inputs"
@@ -33,13 +42,14 @@ OLD_YUBIKEY_INPUT = REPOSITORY_DESCRIPTION_INPUT_DIR / "with_old_yubikey.json"
 
 AUTH_REPO_NAME = "auth"
 DEPENDENCY_NAME = "dependency/auth"
+LIBRARY_NAMESPACE = "namespace"
 
 
 @pytest.fixture(scope="module")
 def api_repo_path(repo_dir):
     path = repo_dir / "api" / "auth"
     yield path
-    shutil.rmtree(path.parent, onerror=on_rm_error)
+    remove_directory(path.parent)
 
 
 @pytest.fixture(scope="session")
@@ -82,7 +92,7 @@ def auth_repo_path(repo_dir):
     random_name = str(uuid.uuid4())
     path = repo_dir / "api" / random_name / "auth"
     yield path
-    shutil.rmtree(path.parent, onerror=on_rm_error)
+    remove_directory(path.parent)
 
 
 @pytest.fixture
@@ -127,37 +137,64 @@ def no_yubikeys_path():
     return str(NO_YUBIKEYS_INPUT)
 
 
+@pytest.fixture(scope="session")
+def target_repo_template(repo_dir):
+    path = repo_dir / "target_repo_template"
+    path.mkdir()
+    template_repo = GitRepository(path=path)
+    template_repo.init_repo()
+    template_repo.commit_empty("Initial commit")
+    return path
+
+
 @pytest.fixture(scope="module")
-def library(repo_dir):
+def library(repo_dir, target_repo_template):
     random_name = str(uuid.uuid4())
-    root_dir = repo_dir / random_name
+    # the namespace is the same in all libraries so that the prebuilt authentication
+    # repository, whose repositories.json references the target repositories, can be reused
+    root_dir = repo_dir / random_name / LIBRARY_NAMESPACE
     # create an initialize some target repositories
     # their content is not important
     auth_path = root_dir / AUTH_REPO_NAME
     auth_path.mkdir(exist_ok=True, parents=True)
     targets = ("target1", "target2", "target3", "new_target")
-    for target in targets:
-        target_repo_path = root_dir / target
-        target_repo_path.mkdir()
-        target_repo = GitRepository(path=target_repo_path)
-        target_repo.init_repo()
-        target_repo.commit_empty("Initial commit")
-    yield root_dir
-    shutil.rmtree(root_dir, onerror=on_rm_error)
 
+    # git objects are never modified after being written, so they can be shared
+    # between the copies, while refs, logs and other files have to be copied
+    objects_dir = target_repo_template / ".git" / "objects"
 
-@pytest.fixture(scope="function")
-def auth_repo_when_add_repositories_json(
-    library: Path,
+    def _copy_file(src, dst):
+        if objects_dir in Path(src).parents:
+            os.link(src, dst)
+        else:
+            shutil.copy2(src, dst)
+
+    def _copy_template(target):
+        shutil.copytree(
+            target_repo_template, root_dir / target, copy_function=_copy_file
+        )
+
+    # safe to run concurrently, each repository is copied to a different directory
+    with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        list(executor.map(_copy_template, targets))
+    # removed together with repo_dir at the end of the session
+    return root_dir
+
+
+@pytest.fixture(scope="session")
+def prebuilt_auth_repo_when_add_repositories_json(
+    tmp_path_factory: pytest.TempPathFactory,
     with_delegations_no_yubikeys_path: str,
     keystore_delegations: str,
     repositories_json_template: Dict,
     mirrors_json_path: Path,
     pin_manager: PinManager,
 ):
-    repo_path = library / "auth"
-    namespace = library.name
-    copy_repositories_json(repositories_json_template, namespace, repo_path)
+    """
+    Create and sign the repository only once per session. Tests work with its copies
+    """
+    repo_path = tmp_path_factory.mktemp("prebuilt") / LIBRARY_NAMESPACE / "auth"
+    copy_repositories_json(repositories_json_template, LIBRARY_NAMESPACE, repo_path)
     copy_mirrors_json(mirrors_json_path, repo_path)
     create_repository(
         str(repo_path),
@@ -166,9 +203,84 @@ def auth_repo_when_add_repositories_json(
         keystore=keystore_delegations,
         commit=True,
     )
+    return repo_path
+
+
+@pytest.fixture(scope="module")
+def initial_auth_repo_when_add_repositories_json(
+    library: Path,
+    prebuilt_auth_repo_when_add_repositories_json: Path,
+):
+    """
+    Copy the prebuilt repository once per module and return it together with its initial commit
+    """
+    repo_path = library / "auth"
+    shutil.copytree(
+        prebuilt_auth_repo_when_add_repositories_json, repo_path, dirs_exist_ok=True
+    )
     auth_reo = AuthenticationRepository(path=repo_path)
-    yield auth_reo
-    shutil.rmtree(repo_path, onerror=on_rm_error)
+    return auth_reo, auth_reo.head_commit()
+
+
+@pytest.fixture(scope="module")
+def initial_commit_when_add_repositories_json(
+    initial_auth_repo_when_add_repositories_json,
+):
+    _, initial_commit = initial_auth_repo_when_add_repositories_json
+    return initial_commit
+
+
+@pytest.fixture(scope="function")
+def auth_repo_when_add_repositories_json(
+    initial_auth_repo_when_add_repositories_json,
+):
+    """
+    Instead of creating a new repository for each test, which requires signing all
+    metadata files, reset the repository to its initial commit after every test
+    """
+    initial_auth_repo, initial_commit = initial_auth_repo_when_add_repositories_json
+    yield AuthenticationRepository(path=initial_auth_repo.path)
+    initial_auth_repo.reset_to_commit(initial_commit, hard=True)
+    initial_auth_repo.clean()
+
+
+@pytest.fixture(scope="module")
+def commit_with_test_file_when_add_repositories_json(
+    initial_auth_repo_when_add_repositories_json,
+    pin_manager: PinManager,
+    keystore_delegations: str,
+):
+    """
+    Register test.txt once per module and return the resulting commit. The repository
+    is then reset to its initial commit, so that other tests are not affected
+    """
+    initial_auth_repo, initial_commit = initial_auth_repo_when_add_repositories_json
+    file_path = initial_auth_repo.path / TARGETS_DIRECTORY_NAME / "test.txt"
+    file_path.write_text("test")
+    register_target_files(
+        initial_auth_repo.path,
+        pin_manager,
+        keystore_delegations,
+        update_snapshot_and_timestamp=True,
+        push=False,
+    )
+    commit = initial_auth_repo.head_commit()
+    initial_auth_repo.reset_to_commit(initial_commit, hard=True)
+    return commit
+
+
+@pytest.fixture(scope="function")
+def auth_repo_with_test_file_when_add_repositories_json(
+    initial_auth_repo_when_add_repositories_json,
+    commit_with_test_file_when_add_repositories_json,
+):
+    initial_auth_repo, initial_commit = initial_auth_repo_when_add_repositories_json
+    initial_auth_repo.reset_to_commit(
+        commit_with_test_file_when_add_repositories_json, hard=True
+    )
+    yield AuthenticationRepository(path=initial_auth_repo.path)
+    initial_auth_repo.reset_to_commit(initial_commit, hard=True)
+    initial_auth_repo.clean()
 
 
 def _init_auth_repo_dir():
@@ -183,14 +295,14 @@ def _init_auth_repo_dir():
 def child_repo_path():
     repo_path = _init_auth_repo_dir()
     yield repo_path
-    shutil.rmtree(str(repo_path.parent), onerror=on_rm_error)
+    remove_directory(str(repo_path.parent))
 
 
 @pytest.fixture(scope="module")
 def parent_repo_path():
     repo_path = _init_auth_repo_dir()
     yield repo_path
-    shutil.rmtree(str(repo_path.parent), onerror=on_rm_error)
+    remove_directory(str(repo_path.parent))
 
 
 @pytest.fixture(scope="module")
@@ -199,7 +311,7 @@ def roles_keystore(keystore_delegations):
     # new keystore files are expected to be created and store to this directory
     # it will be removed once this test's execution is done
     # Create the destination folder if it doesn't exist
-    roles_keystore = KEYSTORES_PATH / "roles_keystore"
+    roles_keystore = KEYSTORES_PATH / "roles_keystore" / XDIST_WORKER
     if roles_keystore.is_dir():
         shutil.rmtree(str(roles_keystore))
 
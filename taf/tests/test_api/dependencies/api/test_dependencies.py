@@ -7,6 +7,7 @@ import taf.repositoriesdb as repositoriesdb
 from taf.auth_repo import AuthenticationRepository
 from taf.api.repository import create_repository
 from taf.tests.test_api.conftest import DEPENDENCY_NAME
+from taf.tests.test_api.util import get_new_commits
 from taf.yubikey.yubikey_manager import PinManager
 
 
@@ -34,7 +35,7 @@ def test_add_dependency_when_on_filesystem_invalid_commit(
     pin_manager,
 ):
     auth_repo = AuthenticationRepository(path=parent_repo_path)
-    initial_commits_num = len(auth_repo.list_pygit_commits())
+    initial_commit = auth_repo.head_commit()
     child_repository = AuthenticationRepository(path=child_repo_path)
 
     with pytest.raises(TAFError):
@@ -48,8 +49,8 @@ def test_add_dependency_when_on_filesystem_invalid_commit(
             no_prompt=True,
             push=False,
         )
-    commits = auth_repo.list_pygit_commits()
-    assert len(commits) == initial_commits_num
+    commits = get_new_commits(auth_repo, initial_commit)
+    assert len(commits) == 0
 
 
 def test_add_dependency_when_on_filesystem(
@@ -59,7 +60,7 @@ def test_add_dependency_when_on_filesystem(
     pin_manager,
 ):
     auth_repo = AuthenticationRepository(path=parent_repo_path)
-    initial_commits_num = len(auth_repo.list_pygit_commits())
+    initial_commit = auth_repo.head_commit()
     child_repository = AuthenticationRepository(path=child_repo_path)
 
     add_dependency(
@@ -72,8 +73,8 @@ def test_add_dependency_when_on_filesystem(
         no_prompt=True,
         push=False,
     )
-    commits = auth_repo.list_pygit_commits()
-    assert len(commits) == initial_commits_num + 1
+    commits = get_new_commits(auth_repo, initial_commit)
+    assert len(commits) == 1
     assert commits[0].message.strip() == git_commit_message(
         "add-dependency", dependency_name=child_repository.name
     )
@@ -91,7 +92,7 @@ def test_add_dependency_when_not_on_filesystem(
     parent_repo_path, keystore_delegations, pin_manager
 ):
     auth_repo = AuthenticationRepository(path=parent_repo_path)
-    initial_commits_num = len(auth_repo.list_pygit_commits())
+    initial_commit = auth_repo.head_commit()
     branch_name = "main"
     out_of_band_hash = "66d7f48e972f9fa25196523f469227dfcd85c994"
     add_dependency(
@@ -104,8 +105,8 @@ def test_add_dependency_when_not_on_filesystem(
         no_prompt=True,
         push=False,
     )
-    commits = auth_repo.list_pygit_commits()
-    assert len(commits) == initial_commits_num + 1
+    commits = get_new_commits(auth_repo, initial_commit)
+    assert len(commits) == 1
     assert commits[0].message.strip() == git_commit_message(
         "add-dependency", dependency_name=DEPENDENCY_NAME
     )
@@ -123,7 +124,7 @@ def test_remove_dependency(
     parent_repo_path, child_repo_path, keystore_delegations, pin_manager
 ):
     auth_repo = AuthenticationRepository(path=parent_repo_path)
-    initial_commits_num = len(auth_repo.list_pygit_commits())
+    initial_commit = auth_repo.head_commit()
     child_repository = AuthenticationRepository(path=child_repo_path)
 
     remove_dependency(
@@ -133,8 +134,8 @@ def test_remove_dependency(
         keystore=keystore_delegations,
         push=False,
     )
-    commits = auth_repo.list_pygit_commits()
-    assert len(commits) == initial_commits_num + 1
+    commits = get_new_commits(auth_repo, initial_commit)
+    assert len(commits) == 1
     assert commits[0].message.strip() == git_commit_message(
         "remove-dependency", dependency_name=child_repository.name
     )
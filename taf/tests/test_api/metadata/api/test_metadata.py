@@ -8,6 +8,7 @@ from taf.api.repository import create_repository
 from taf.api.metadata import check_expiration_dates, update_metadata_expiration_date
 
 from tuf.api.metadata import Root, Snapshot, Timestamp, Targets
+from taf.tests.test_api.util import get_new_commits
 from taf.yubikey.yubikey_manager import PinManager
 
 
@@ -65,7 +66,8 @@ def test_update_root_metadata(
     # targets should not be updated
     auth_repo_path = auth_repo_expired.path
     auth_repo = AuthenticationRepository(path=auth_repo_path)
-    initial_commits_num = len(auth_repo.list_pygit_commits())
+    initial_commit = auth_repo.head_commit()
+    assert initial_commit is not None
     roles = [Root.type]
     INTERVAL = 180
     timestamp_version = auth_repo_expired.timestamp().version
@@ -78,8 +80,8 @@ def test_update_root_metadata(
         keystore=keystore_delegations,
         push=False,
     )
-    commits = auth_repo.list_pygit_commits()
-    assert len(commits) == initial_commits_num + 1
+    commits = get_new_commits(auth_repo, initial_commit)
+    assert len(commits) == 1
     assert commits[0].message.strip() == git_commit_message(
         "update-expiration-dates", roles=",".join(roles)
     )
@@ -128,7 +130,8 @@ def test_update_snapshot_metadata(
     # targets should not be updated
     auth_repo_path = auth_repo_expired.path
     auth_repo = AuthenticationRepository(path=auth_repo_path)
-    initial_commits_num = len(auth_repo.list_pygit_commits())
+    initial_commit = auth_repo.head_commit()
+    assert initial_commit is not None
     roles = [Snapshot.type]
     INTERVAL = 7
     timestamp_version = auth_repo_expired.timestamp().version
@@ -141,8 +144,8 @@ def test_update_snapshot_metadata(
         keystore=keystore_delegations,
         push=False,
     )
-    commits = auth_repo.list_pygit_commits()
-    assert len(commits) == initial_commits_num + 1
+    commits = get_new_commits(auth_repo, initial_commit)
+    assert len(commits) == 1
     assert commits[0].message.strip() == git_commit_message(
         "update-expiration-dates", roles=",".join(roles)
     )
@@ -160,7 +163,8 @@ def test_update_timestamp_metadata(
     # targets should not be updated
     auth_repo_path = auth_repo_expired.path
     auth_repo = AuthenticationRepository(path=auth_repo_path)
-    initial_commits_num = len(auth_repo.list_pygit_commits())
+    initial_commit = auth_repo.head_commit()
+    assert initial_commit is not None
     roles = [Timestamp.type]
     INTERVAL = 1
     timestamp_version = auth_repo_expired.timestamp().version
@@ -173,8 +177,8 @@ def test_update_timestamp_metadata(
         keystore=keystore_delegations,
         push=False,
     )
-    commits = auth_repo.list_pygit_commits()
-    assert len(commits) == initial_commits_num + 1
+    commits = get_new_commits(auth_repo, initial_commit)
+    assert len(commits) == 1
     assert commits[0].message.strip() == git_commit_message(
         "update-expiration-dates", roles=",".join(roles)
     )
@@ -192,7 +196,8 @@ def test_update_multiple_roles_metadata(
     # targets should not be updated
     auth_repo_path = auth_repo_expired.path
     auth_repo = AuthenticationRepository(path=auth_repo_path)
-    initial_commits_num = len(auth_repo.list_pygit_commits())
+    initial_commit = auth_repo.head_commit()
+    assert initial_commit is not None
     roles = [Targets.type, "delegated_role", "inner_role"]
     INTERVAL = 365
     timestamp_version = auth_repo_expired.timestamp().version
@@ -205,8 +210,8 @@ def test_update_multiple_roles_metadata(
         keystore=keystore_delegations,
         push=False,
     )
-    commits = auth_repo.list_pygit_commits()
-    assert len(commits) == initial_commits_num + 1
+    commits = get_new_commits(auth_repo, initial_commit)
+    assert len(commits) == 1
     assert commits[0].message.strip() == git_commit_message(
         "update-expiration-dates", roles=",".join(roles)
     )
@@ -10,7 +10,7 @@ from taf.api.roles import (
 )
 from taf.messages import git_commit_message
 from taf.auth_repo import AuthenticationRepository
-from taf.tests.test_api.util import check_new_role
+from taf.tests.test_api.util import check_new_role, get_new_commits
 from taf.yubikey.yubikey_manager import PinManager
 
 
@@ -19,7 +19,8 @@ def test_add_role_when_target_is_parent(
     roles_keystore: str,
     pin_manager: PinManager,
 ):
-    initial_commits_num = len(auth_repo.list_pygit_commits())
+    initial_commit = auth_repo.head_commit()
+    assert initial_commit is not None
     ROLE_NAME = "new_role"
     PATHS = ["some-path1", "some-path2"]
     PARENT_NAME = "targets"
@@ -37,8 +38,8 @@ def test_add_role_when_target_is_parent(
         push=False,
         skip_prompt=True,
     )
-    commits = auth_repo.list_pygit_commits()
-    assert len(commits) == initial_commits_num + 1
+    commits = get_new_commits(auth_repo, initial_commit)
+    assert len(commits) == 1
     assert commits[0].message.strip() == git_commit_message("add-role", role=ROLE_NAME)
     check_new_role(auth_repo, ROLE_NAME, PATHS, roles_keystore, PARENT_NAME)
 
@@ -48,7 +49,8 @@ def test_add_role_when_delegated_role_is_parent(
     roles_keystore: str,
     pin_manager: PinManager,
 ):
-    initial_commits_num = len(auth_repo_with_delegations.list_pygit_commits())
+    initial_commit = auth_repo_with_delegations.head_commit()
+    assert initial_commit is not None
     ROLE_NAME = "new_inner_role"
     PATHS = ["inner-path1", "inner-path2"]
     PARENT_NAME = "delegated_role"
@@ -66,8 +68,8 @@ def test_add_role_when_delegated_role_is_parent(
         push=False,
         skip_prompt=True,
     )
-    commits = auth_repo_with_delegations.list_pygit_commits()
-    assert len(commits) == initial_commits_num + 1
+    commits = get_new_commits(auth_repo_with_delegations, initial_commit)
+    assert len(commits) == 1
     assert commits[0].message.strip() == git_commit_message("add-role", role=ROLE_NAME)
     check_new_role(
         auth_repo_with_delegations, ROLE_NAME, PATHS, roles_keystore, PARENT_NAME
@@ -80,7 +82,8 @@ def test_add_multiple_roles(
     roles_keystore: str,
     add_roles_config_json_input: str,
 ):
-    initial_commits_num = len(auth_repo.list_pygit_commits())
+    initial_commit = auth_repo.head_commit()
+    assert initial_commit is not None
     add_roles(
         path=str(auth_repo.path),
         pin_manager=pin_manager,
@@ -90,8 +93,8 @@ def test_add_multiple_roles(
     )
     # with_delegations_no_yubikeys_path specification contains delegated_role and inner_role
     # definitions, so these two roles should get added to the repository
-    commits = auth_repo.list_pygit_commits()
-    assert len(commits) == initial_commits_num + 1
+    commits = get_new_commits(auth_repo, initial_commit)
+    assert len(commits) == 1
     new_roles = ["delegated_role"]
     assert commits[0].message.strip() == git_commit_message(
         "add-roles", roles=", ".join(new_roles)
@@ -107,7 +110,8 @@ def test_add_role_paths(
     roles_keystore: str,
     pin_manager: PinManager,
 ):
-    initial_commits_num = len(auth_repo_with_delegations.list_pygit_commits())
+    initial_commit = auth_repo_with_delegations.head_commit()
+    assert initial_commit is not None
     NEW_PATHS = ["some-path3"]
     ROLE_NAME = "delegated_role"
     add_role_paths(
@@ -120,8 +124,8 @@ def test_add_role_paths(
         push=False,
     )
 
-    commits = auth_repo_with_delegations.list_pygit_commits()
-    assert len(commits) == initial_commits_num + 1
+    commits = get_new_commits(auth_repo_with_delegations, initial_commit)
+    assert len(commits) == 1
     assert commits[0].message.strip() == git_commit_message(
         "add-role-paths", paths=", ".join(NEW_PATHS), role=ROLE_NAME
     )
@@ -135,7 +139,8 @@ def test_remove_role_paths(
     roles_keystore: str,
     pin_manager: PinManager,
 ):
-    initial_commits_num = len(auth_repo_with_delegations.list_pygit_commits())
+    initial_commit = auth_repo_with_delegations.head_commit()
+    assert initial_commit is not None
     REMOVED_PATHS = ["dir2/path1"]
     ROLE_NAME = "delegated_role"
     remove_paths(
@@ -146,8 +151,8 @@ def test_remove_role_paths(
         push=False,
     )
 
-    commits = auth_repo_with_delegations.list_pygit_commits()
-    assert len(commits) == initial_commits_num + 1
+    commits = get_new_commits(auth_repo_with_delegations, initial_commit)
+    assert len(commits) == 1
     assert commits[0].message.strip() == git_commit_message(
         "remove-role-paths", paths=", ".join(REMOVED_PATHS), role=ROLE_NAME
     )
@@ -256,7 +261,8 @@ def test_add_signing_key(
     auth_repo: AuthenticationRepository, roles_keystore: str, pin_manager: PinManager
 ):
     auth_repo = AuthenticationRepository(path=auth_repo.path)
-    initial_commits_num = len(auth_repo.list_pygit_commits())
+    initial_commit = auth_repo.head_commit()
+    assert initial_commit is not None
     # for testing purposes, add targets signing key to timestamp and snapshot roles
     pub_key_path = Path(roles_keystore, "targets1.pub")
     COMMIT_MSG = "Add new timestamp and snapshot signing key"
@@ -269,8 +275,8 @@ def test_add_signing_key(
         push=False,
         commit_msg=COMMIT_MSG,
     )
-    commits = auth_repo.list_pygit_commits()
-    assert len(commits) == initial_commits_num + 1
+    commits = get_new_commits(auth_repo, initial_commit)
+    assert len(commits) == 1
     assert commits[0].message.strip() == COMMIT_MSG
     timestamp_keys_infos = list_keys_of_role(str(auth_repo.path), "timestamp")
     assert len(timestamp_keys_infos) == 2
@@ -284,7 +290,8 @@ def test_revoke_signing_key(
     auth_repo = AuthenticationRepository(path=auth_repo.path)
     targest_keyids = auth_repo.get_keyids_of_role("targets")
     key_to_remove = targest_keyids[-1]
-    initial_commits_num = len(auth_repo.list_pygit_commits())
+    initial_commit = auth_repo.head_commit()
+    assert initial_commit is not None
     targets_keys_infos = list_keys_of_role(str(auth_repo.path), "targets")
     assert len(targets_keys_infos) == 2
     COMMIT_MSG = "Revoke a targets key"
@@ -296,8 +303,8 @@ def test_revoke_signing_key(
         push=False,
         commit_msg=COMMIT_MSG,
     )
-    commits = auth_repo.list_pygit_commits()
-    assert len(commits) == initial_commits_num + 1
+    commits = get_new_commits(auth_repo, initial_commit)
+    assert len(commits) == 1
     targets_keys_infos = list_keys_of_role(str(auth_repo.path), "targets")
     assert len(targets_keys_infos) == 1
     assert commits[0].message.strip() == COMMIT_MSG
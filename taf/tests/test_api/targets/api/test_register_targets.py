@@ -0,0 +1,71 @@
+from pathlib import Path
+
+from taf.constants import TARGETS_DIRECTORY_NAME
+from taf.messages import git_commit_message
+from taf.auth_repo import AuthenticationRepository
+from taf.models.types import Commitish
+
+from taf.api.targets import register_target_files
+from taf.tests.test_api.util import check_if_targets_signed, get_new_commits
+from taf.yubikey.yubikey_manager import PinManager
+
+UPDATE_TARGETS_COMMIT_MSG = git_commit_message("update-targets")
+
+
+def test_register_targets_when_file_added(
+    auth_repo_when_add_repositories_json: AuthenticationRepository,
+    initial_commit_when_add_repositories_json: Commitish,
+    pin_manager: PinManager,
+    library: Path,
+    keystore_delegations: str,
+):
+    repo_path = library / "auth"
+    FILENAME = "test.txt"
+    # add a new file to the targets directory, check if it was signed
+    file_path = repo_path / TARGETS_DIRECTORY_NAME / FILENAME
+    file_path.write_text("test")
+    register_target_files(
+        repo_path,
+        pin_manager,
+        keystore_delegations,
+        update_snapshot_and_timestamp=True,
+        push=False,
+    )
+    check_if_targets_signed(auth_repo_when_add_repositories_json, "targets", FILENAME)
+    commits = get_new_commits(
+        auth_repo_when_add_repositories_json, initial_commit_when_add_repositories_json
+    )
+    assert len(commits) == 1
+    assert commits[0].message.strip() == UPDATE_TARGETS_COMMIT_MSG
+
+
+def test_register_targets_when_file_removed(
+    auth_repo_with_test_file_when_add_repositories_json: AuthenticationRepository,
+    commit_with_test_file_when_add_repositories_json: Commitish,
+    pin_manager: PinManager,
+    library: Path,
+    keystore_delegations: str,
+):
+    repo_path = library / "auth"
+    FILENAME = "test.txt"
+    # the file was registered by the fixture, remove it and check if it is no longer signed
+    file_path = repo_path / TARGETS_DIRECTORY_NAME / FILENAME
+    assert file_path.is_file()
+    file_path.unlink()
+    register_target_files(
+        repo_path,
+        pin_manager,
+        keystore_delegations,
+        update_snapshot_and_timestamp=True,
+        push=False,
+    )
+    signed_target_files = (
+        auth_repo_with_test_file_when_add_repositories_json.get_signed_target_files()
+    )
+    assert FILENAME not in signed_target_files
+    commits = get_new_commits(
+        auth_repo_with_test_file_when_add_repositories_json,
+        commit_with_test_file_when_add_repositories_json,
+    )
+    assert len(commits) == 1
+    assert commits[0].message.strip() == UPDATE_TARGETS_COMMIT_MSG
@@ -0,0 +1,152 @@
+from pathlib import Path
+
+import pytest
+
+from taf.messages import git_commit_message
+import taf.repositoriesdb as repositoriesdb
+from taf.auth_repo import AuthenticationRepository
+from taf.models.types import Commitish
+
+from taf.api.targets import add_target_repo
+from taf.tests.test_api.util import get_new_commits
+from taf.yubikey.yubikey_manager import PinManager
+
+
+# target4 does not exist on the filesystem, new_target does
+@pytest.mark.parametrize(
+    "target_name",
+    ["target4", "new_target"],
+    ids=["when_not_on_filesystem", "when_on_filesystem"],
+)
+def test_add_target_repository(
+    auth_repo_when_add_repositories_json: AuthenticationRepository,
+    initial_commit_when_add_repositories_json: Commitish,
+    pin_manager: PinManager,
+    library: Path,
+    keystore_delegations: str,
+    target_name: str,
+):
+    repo_path = str(library / "auth")
+    namespace = library.name
+    target_repo_name = f"{namespace}/{target_name}"
+    add_target_repo(
+        repo_path,
+        pin_manager,
+        None,
+        target_repo_name,
+        "delegated_role",
+        None,
+        keystore_delegations,
+        push=False,
+        should_create_new_role=True,
+    )
+    # verify repositories.json was updated and that changes were committed
+    # then validate the repository
+    repositories_json = repositoriesdb.load_repositories_json(
+        auth_repo_when_add_repositories_json
+    )
+    assert repositories_json is not None
+    repositories = repositories_json["repositories"]
+    assert target_repo_name in repositories
+    commits = get_new_commits(
+        auth_repo_when_add_repositories_json, initial_commit_when_add_repositories_json
+    )
+    assert len(commits) == 2
+    assert commits[0].message.strip() == git_commit_message(
+        "add-target", target_name=target_repo_name
+    )
+    delegated_paths = auth_repo_when_add_repositories_json.get_paths_of_role(
+        "delegated_role"
+    )
+    assert target_repo_name in delegated_paths
+
+
+# def test_remove_target_repository_when_not_on_filesystem(
+#     auth_repo_when_add_repositories_json: AuthenticationRepository,
+#     library: Path,
+#     keystore_delegations: str,
+# ):
+#     repo_path = str(library / "auth")
+#     initial_commits_num = len(auth_repo_when_add_repositories_json.list_pygit_commits())
+#     namespace = library.name
+#     target_repo_name = f"{namespace}/target4"
+#     repositories_json = repositoriesdb.load_repositories_json(
+#         auth_repo_when_add_repositories_json
+#     )
+#     assert repositories_json is not None
+#     repositories = repositories_json["repositories"]
+#     assert target_repo_name in repositories
+#     remove_target_repo(
+#         str(repo_path),
+#         target_repo_name,
+#         keystore_delegations,
+#         push=False,
+#     )
+#     # verify repositories.json was updated and that changes were committed
+#     # then validate the repository
+#     # target repo should not be in the newest repositories.json
+#     repositories_json = repositoriesdb.load_repositories_json(
+#         auth_repo_when_add_repositories_json
+#     )
+#     assert repositories_json is not None
+#     repositories = repositories_json["repositories"]
+#     assert target_repo_name not in repositories
+#     commits = auth_repo_when_add_repositories_json.list_pygit_commits()
+#     # this function is expected to commit twice
+#     assert len(commits) == initial_commits_num + 2
+#     assert commits[1].message.strip() == git_commit_message(
+#         "remove-target", target_name=target_repo_name
+#     )
+#     assert commits[0].message.strip() == git_commit_message(
+#         "remove-from-delegated-paths", target_name=target_repo_name
+#     )
+#     delegated_paths = auth_repo_when_add_repositories_json.get_paths_of_role(
+#         "delegated_role"
+#     )
+#     assert target_repo_name not in delegated_paths
+
+
+# def test_remove_target_repository_when_on_filesystem(
+#     auth_repo_when_add_repositories_json: AuthenticationRepository,
+#     library: Path,
+#     keystore_delegations: str,
+# ):
+#     repo_path = str(library / "auth")
+#     initial_commits_num = len(auth_repo_when_add_repositories_json.list_pygit_commits())
+#     namespace = library.name
+#     target_repo_name = f"{namespace}/new_target"
+#     repositories_json = repositoriesdb.load_repositories_json(
+#         auth_repo_when_add_repositories_json
+#     )
+#     assert repositories_json is not None
+#     repositories = repositories_json["repositories"]
+#     assert target_repo_name in repositories
+#     remove_target_repo(
+#         str(repo_path),
+#         target_repo_name,
+#         keystore_delegations,
+#         push=False,
+#     )
+#     # verify that repositories.json was updated and that changes were committed
+#     # then validate the repository
+#     # target repo should not be in the newest repositories.json
+#     repositories_json = repositoriesdb.load_repositories_json(
+#         auth_repo_when_add_repositories_json
+#     )
+#     assert repositories_json is not None
+#     repositories = repositories_json["repositories"]
+#     assert target_repo_name not in repositories
+#     commits = auth_repo_when_add_repositories_json.list_pygit_commits()
+#     # this function is expected to commit twice
+#     assert len(commits) == initial_commits_num + 2
+#     assert commits[1].message.strip() == git_commit_message(
+#         "remove-target", target_name=target_repo_name
+#     )
+#     assert commits[0].message.strip() == git_commit_message(
+#         "remove-from-delegated-paths", target_name=target_repo_name
+#     )
+#     delegated_paths = auth_repo_when_add_repositories_json.get_paths_of_role(
+#         "delegated_role"
+#     )
+#     assert target_repo_name not in delegated_paths
+#     assert not Path(repo_path, TARGETS_DIRECTORY_NAME, target_repo_name).is_file()
@@ -0,0 +1,48 @@
+from pathlib import Path
+
+from taf.messages import git_commit_message
+from taf.auth_repo import AuthenticationRepository
+from taf.models.types import Commitish
+
+from taf.api.targets import update_target_repos_from_repositories_json
+from taf.tests.test_api.util import (
+    check_target_file,
+    get_new_commits,
+    get_targets_at_revision,
+)
+from taf.yubikey.yubikey_manager import PinManager
+
+
+def test_update_target_repos_from_repositories_json(
+    auth_repo_when_add_repositories_json: AuthenticationRepository,
+    initial_commit_when_add_repositories_json: Commitish,
+    pin_manager: PinManager,
+    library: Path,
+    keystore_delegations: str,
+):
+    repo_path = library / "auth"
+    namespace = library.name
+    library_dir = library.parent
+    update_target_repos_from_repositories_json(
+        str(repo_path),
+        pin_manager,
+        str(library_dir),
+        keystore_delegations,
+        push=False,
+    )
+    # this should create target files and save commit and branch to them, then sign
+    targets = get_targets_at_revision(auth_repo_when_add_repositories_json)
+    for name in ("target1", "target2", "target3"):
+        target_repo_name = f"{namespace}/{name}"
+        target_repo_path = library_dir / target_repo_name
+        assert check_target_file(
+            target_repo_path,
+            target_repo_name,
+            auth_repo_when_add_repositories_json,
+            targets=targets,
+        )
+    commits = get_new_commits(
+        auth_repo_when_add_repositories_json, initial_commit_when_add_repositories_json
+    )
+    assert len(commits) == 1
+    assert commits[0].message.strip() == git_commit_message("update-targets")
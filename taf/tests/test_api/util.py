@@ -1,5 +1,6 @@
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
+import pygit2
 from taf.auth_repo import AuthenticationRepository
 from taf.git import GitRepository
 from typing import List
@@ -13,20 +14,27 @@ def check_target_file(
     target_repo_name: str,
     auth_repo: AuthenticationRepository,
     auth_repo_head_sha: Optional[Commitish] = None,
+    targets: Optional[Dict] = None,
 ):
-    if auth_repo_head_sha is None:
-        auth_repo_head_sha = auth_repo.head_commit()
+    """
+    Check if the target file of the specified target repository contains its head commit
+    and default branch. When checking several target repositories, load the content
+    of all target files only once using get_targets_at_revision and pass it in as targets
+    """
     target_repo = GitRepository(path=target_repo_path)
     target_repo_head_sha = target_repo.head_commit()
     assert target_repo_head_sha
-    repositoriesdb.load_repositories(auth_repo)
-    target_repos = {
-        target_repo_name: repositoriesdb.get_repository(auth_repo, target_repo_name)
-    }
-    targets = auth_repo.targets_at_revisions(
-        commits=[auth_repo_head_sha], target_repos=target_repos
-    )
-    target_content = targets[auth_repo_head_sha][target_repo_name]
+    if targets is None:
+        if auth_repo_head_sha is None:
+            auth_repo_head_sha = auth_repo.head_commit()
+        repositoriesdb.load_repositories(auth_repo)
+        target_repos = {
+            target_repo_name: repositoriesdb.get_repository(auth_repo, target_repo_name)
+        }
+        targets = auth_repo.targets_at_revisions(
+            commits=[auth_repo_head_sha], target_repos=target_repos
+        )[auth_repo_head_sha]
+    target_content = targets[target_repo_name]
     branch = target_repo.default_branch
     return (
         target_repo_head_sha.value == target_content["commit"]
@@ -34,6 +42,33 @@ def check_target_file(
     )
 
 
+def get_targets_at_revision(
+    auth_repo: AuthenticationRepository,
+    auth_repo_head_sha: Optional[Commitish] = None,
+) -> Dict:
+    """
+    Return the content of all target files at the specified (or the latest) revision
+    """
+    if auth_repo_head_sha is None:
+        auth_repo_head_sha = auth_repo.head_commit()
+    return auth_repo.targets_at_revisions(commits=[auth_repo_head_sha])[
+        auth_repo_head_sha
+    ]
+
+
+def get_new_commits(
+    auth_repo: AuthenticationRepository, initial_commit: Commitish
+) -> List[pygit2.Commit]:
+    """
+    Return commits created after the initial commit, starting with the most recent one.
+    Only new commits are traversed, unlike when listing all commits
+    """
+    repo = auth_repo.pygit_repo
+    walker = repo.walk(repo.head.target)
+    walker.hide(initial_commit.hash)
+    return list(walker)
+
+
 def check_if_targets_signed(
     auth_repo: AuthenticationRepository,
     signing_role: str,
@@ -1,5 +1,11 @@
 import json
-from taf.utils import normalize_line_endings, safely_save_json_to_disk, safely_move_file
+from taf.utils import (
+    iter_relative_file_paths,
+    normalize_line_endings,
+    read_json_file,
+    safely_save_json_to_disk,
+    safely_move_file,
+)
 
 
 def test_normalize_line_ending_extra_lines():
@@ -51,3 +57,39 @@ def test_safely_move_file_same_filesystem(output_path):
     assert not src_path.is_file()
     assert dst_path.is_file()
     assert dst_path.read_text() == data
+
+
+def test_iter_relative_file_paths(output_path):
+    base_path = output_path / "walk"
+    (base_path / "dir1" / "dir2").mkdir(parents=True)
+    (base_path / "empty").mkdir()
+    (base_path / "file1").write_text("1")
+    (base_path / "dir1" / "file2").write_text("2")
+    (base_path / "dir1" / "dir2" / "file3").write_text("3")
+    actual = set(iter_relative_file_paths(base_path))
+    assert actual == {"file1", "dir1/file2", "dir1/dir2/file3"}
+    assert actual == {
+        path.relative_to(base_path).as_posix()
+        for path in base_path.rglob("*")
+        if path.is_file()
+    }
+
+
+def test_iter_relative_file_paths_missing_dir(output_path):
+    assert list(iter_relative_file_paths(output_path / "does-not-exist")) == []
+
+
+def test_read_json_file_returns_copy(output_path):
+    json_path = output_path / "read_copy.json"
+    json_path.write_text(json.dumps({"a": {"b": 1}}))
+    data = read_json_file(json_path)
+    data["a"]["b"] = 2
+    assert read_json_file(json_path) == {"a": {"b": 1}}
+
+
+def test_read_json_file_after_modification(output_path):
+    json_path = output_path / "read_modified.json"
+    json_path.write_text(json.dumps({"a": 1}))
+    assert read_json_file(json_path) == {"a": 1}
+    json_path.write_text(json.dumps({"a": 10}))
+    assert read_json_file(json_path) == {"a": 10}
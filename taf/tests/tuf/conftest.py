@@ -1,21 +1,29 @@
 import pytest
-import shutil
 import uuid
 
-from taf.utils import on_rm_error
+from taf.models.converter import from_dict
+from taf.models.types import RolesKeysData
+from taf.tuf.repository import MetadataRepository
 
 
-@pytest.fixture(scope="module", autouse=True)
-def tuf_repo_dir(repo_dir):
-    path = repo_dir / "tuf"
-    path.mkdir()
-    yield path
-    shutil.rmtree(path, onerror=on_rm_error)
+@pytest.fixture(scope="session")
+def tuf_repo_path(repo_dir):
+    # shared by all modules, fixtures create their repositories inside of it
+    # removed together with repo_dir (stored in memory if possible) at the end of the session
+    path = repo_dir / "tuf" / str(uuid.uuid4())
+    path.mkdir(parents=True)
+    return path
 
 
-@pytest.fixture(scope="module")
-def tuf_repo_path(tuf_repo_dir):
-    random_name = str(uuid.uuid4())
-    path = tuf_repo_dir / random_name / "auth"
-    yield path
-    shutil.rmtree(path.parent, onerror=on_rm_error)
+@pytest.fixture(scope="session")
+def prebuilt_tuf_repo_with_delegations(
+    tuf_repo_path, signers_with_delegations, with_delegations_no_yubikeys_input
+):
+    """
+    Create and sign the metadata only once per session. Tests work with its copies
+    """
+    path = tuf_repo_path / "prebuilt"
+    repo = MetadataRepository(path)
+    roles_keys_data = from_dict(with_delegations_no_yubikeys_input, RolesKeysData)
+    repo.create(roles_keys_data, signers_with_delegations)
+    return path
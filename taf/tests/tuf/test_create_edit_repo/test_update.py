@@ -4,16 +4,14 @@ from taf.models.types import TargetsRole
 from taf.tuf.keys import _get_legacy_keyid
 
 
-def test_update_expiration_date(tuf_repo, signers_with_delegations):
+def test_update_expiration_date(tuf_repo):
 
     assert tuf_repo.root().version == 1
     today = datetime.datetime.now(datetime.timezone.utc).date()
     assert tuf_repo.get_expiration_date("root").date() == today + datetime.timedelta(
         days=365
     )
-    tuf_repo.set_metadata_expiration_date(
-        "root", signers_with_delegations["root"], interval=730
-    )
+    tuf_repo.set_metadata_expiration_date("root", interval=730)
     assert tuf_repo.get_expiration_date("root").date() == today + datetime.timedelta(
         days=730
     )
@@ -23,6 +21,14 @@ def test_update_expiration_date(tuf_repo, signers_with_delegations):
     assert tuf_repo.snapshot().version == 1
 
 
+def test_update_expiration_date_from_start_date(tuf_repo):
+    start_date = datetime.datetime(2030, 1, 1, tzinfo=datetime.timezone.utc)
+    tuf_repo.set_metadata_expiration_date("targets", start_date=start_date, interval=10)
+    assert tuf_repo.get_expiration_date("targets") == start_date + datetime.timedelta(
+        days=10
+    )
+
+
 def test_add_delegated_paths(tuf_repo):
 
     new_paths = ["new", "paths"]
@@ -1,18 +1,16 @@
 import pytest
 import shutil
+import uuid
 
-from taf.utils import on_rm_error
-from taf.models.converter import from_dict
-from taf.models.types import RolesKeysData
 from taf.tuf.repository import MetadataRepository
 
 
 @pytest.fixture(autouse=False)
 def tuf_repo(
-    tuf_repo_path, signers_with_delegations, with_delegations_no_yubikeys_input
+    tuf_repo_path, prebuilt_tuf_repo_with_delegations, signers_with_delegations
 ):
-    repo = MetadataRepository(tuf_repo_path)
-    roles_keys_data = from_dict(with_delegations_no_yubikeys_input, RolesKeysData)
-    repo.create(roles_keys_data, signers_with_delegations)
-    yield repo
-    shutil.rmtree(tuf_repo_path, onerror=on_rm_error)
+    path = tuf_repo_path / str(uuid.uuid4())
+    shutil.copytree(prebuilt_tuf_repo_with_delegations, path)
+    repo = MetadataRepository(path)
+    repo.add_signers_to_cache(signers_with_delegations)
+    return repo
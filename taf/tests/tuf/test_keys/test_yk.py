@@ -8,6 +8,8 @@ import pytest
 
 from securesystemslib.exceptions import UnverifiedSignatureError
 
+# skip the whole module if the yubikey extra (Yubikey Manager) is not installed
+yk = pytest.importorskip("taf.yubikey.yubikey", reason="Yubikey Manager not installed")
 
 # Test data to sign
 _DATA = b"DATA"
@@ -22,22 +24,18 @@ _PUB = b"-----BEGIN PUBLIC KEY-----\nMIIBIjANBgkqhkiG9w0BAQEFAAOCAQ8AMIIBCgKCAQE
 # >>> signer = load_signer_from_file("taf/tests/data/keystores/keystore/root1", None)
 # >>> sig = signer.sign(_DATA)
 # >>> _SIG = bytes.fromhex(sig.signature)
-_SIG = b"\xc1}\xaa\xec\xf6#;\xe6\x89\xc26\x81\x1a;\xd3\xb2\x7f\xce\xe3}\x9a6w}P\xe0d\x8d\xeb\xbcb\xba8\x8c\x96tS\xf2_\xf37\xe8Z\xc4\xf4\x1a\xaa\xdd\xdd%AB#w\x93\xc9\x0f\x8d\xe4\x93)\x9f\xa4)\x0b\xbb\xce\xf4\x9e\x8b\xaa\x1c\xda\xb8\x9ex\xe2\xc8\x9c\x02\\\xb7\x89\x88g\xd3\xb2\x0be\xf4S\x0c*\x0c\xce\xfe\x8aL=\x07\xfa\xe9\xa2\xe1\xed\x1cA\xf9\xbeZR\x91\xae@\x12\xfe<n\xe9;\xa3\xcdr\xabB\x87\x02N\xe5\x8a\x0b3>\xbey`\x07 /)Z_\xd0\xca\x7f\xcey\xe6\x1ee~\x01\x0c\xcfQZ=a\xf6\xe9\xabm_\x12\x8e\xda\xb0\xd4\xaeb1W\x0e\xf0\x909\xae\x05}\x8f\xba\xf7\xa0\\Rx\xe9\x98\x0f4j86\x87\x17\xf5\xff\xc2U\x80oh\xad\xb2\xaf\xa5\x91\x9a\xafI,\xadj\xd5\x02$\xc6\xf8\xf2`y\xd2\xa6\xf3\xce[;\r\xb6y\xd4\xa5\x96y$}{!r\xc1\xfb@\x1e<\xd9\xa0\xe6\x7f\xf1\x17\xe5\x0c\x8e\xbd\xf3\xba"
-
-
-def is_yubikey_manager_installed():
-    try:
-        import taf.yubikey  # noqa: F401
-    except ImportError:
-        return False
-    else:
-        return True
+_SIG = bytes.fromhex(
+    "c17daaecf6233be689c236811a3bd3b27fcee37d9a36777d50e0648debbc62ba"
+    "388c967453f25ff337e85ac4f41aaadddd254142237793c90f8de493299fa429"
+    "0bbbcef49e8baa1cdab89e78e2c89c025cb7898867d3b20b65f4530c2a0ccefe"
+    "8a4c3d07fae9a2e1ed1c41f9be5a5291ae4012fe3c6ee93ba3cd72ab4287024e"
+    "e58a0b333ebe796007202f295a5fd0ca7fce79e61e657e010ccf515a3d61f6e9"
+    "ab6d5f128edab0d4ae6231570ef09039ae057d8fbaf7a05c5278e9980f346a38"
+    "368717f5ffc255806f68adb2afa5919aaf492cad6ad50224c6f8f26079d2a6f3"
+    "ce5b3b0db679d4a59679247d7b2172c1fb401e3cd9a0e67ff117e50c8ebdf3ba"
+)
 
 
-@pytest.mark.skipif(
-    not is_yubikey_manager_installed(),
-    reason="Yubikey Manager not installed)",
-)
 def test_fake_yk(mocker):
     """Test public key export and signing with fake Yubikey."""
     mocker.patch("taf.yubikey.yubikey.export_piv_pub_key", return_value=_PUB)
@@ -67,11 +65,9 @@ def test_fake_yk(mocker):
 def test_real_yk():
     """Test public key export and signing with real Yubikey."""
 
-    import taf.yubikey.yubikey as yk
     from taf.tuf.keys import YkSigner
-    from taf.yubikey.yubikey import get_serial_nums
 
-    serials = get_serial_nums()
+    serials = yk.get_serial_nums()
     serial = serials[0]
     pin_manager = PinManager()
     pin_manager.add_pin(serial, "123456")
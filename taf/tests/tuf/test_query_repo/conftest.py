@@ -1,8 +1,9 @@
+from collections import defaultdict
+from typing import Dict
 import shutil
 from taf.tuf.repository import MetadataRepository
-from taf.utils import on_rm_error
 import pytest
-from taf.models.types import RolesKeysData
+from taf.models.types import RolesKeysData, TargetsRole
 from taf.models.converter import from_dict
 
 
@@ -18,44 +19,59 @@ def tuf_repo_no_delegations(tuf_repo_path, signers, no_yubikeys_input):
     tuf_repo.add_target_files_to_role(
         {"test1.txt": {"target": "test1"}, "test2.txt": {"target": "test2"}}
     )
-    yield tuf_repo
-    shutil.rmtree(path, onerror=on_rm_error)
+    return tuf_repo
 
 
 @pytest.fixture(scope="module")
 def tuf_repo_with_delegations(
-    tuf_repo_path, signers_with_delegations, with_delegations_no_yubikeys_input
+    tuf_repo_path, prebuilt_tuf_repo_with_delegations, signers_with_delegations
 ):
-    # Create new metadata repository
+    # Copy the metadata repository created at the beginning of the session
     path = tuf_repo_path / "repository_with_delegations"
-    path.mkdir(parents=True)
+    shutil.copytree(prebuilt_tuf_repo_with_delegations, path)
     tuf_repo = MetadataRepository(path)
-    roles_keys_data = from_dict(with_delegations_no_yubikeys_input, RolesKeysData)
-    tuf_repo.create(roles_keys_data, signers_with_delegations)
+    tuf_repo.add_signers_to_cache(signers_with_delegations)
 
-    # targets role's targets
-    target_path1 = "test1"
-    target_path2 = "test2"
-    tuf_repo.add_target_files_to_role(
-        {target_path1: {"target": "test1"}, target_path2: {"target": "test2"}}
-    )
-    delegated_path1 = "dir1/path1"
-    delegated_path2 = "dir2/path1"
     custom1 = {"custom_attr1": "custom_val1"}
     custom2 = {"custom_attr2": "custom_val2"}
+    target_files = {
+        # targets role's targets
+        "test1": {"target": "test1"},
+        "test2": {"target": "test2"},
+        # delegated_role's targets
+        "dir1/path1": {"target": "test1", "custom": custom1},
+        "dir2/path1": {"target": "test2", "custom": custom2},
+        # inner_role's targets
+        "dir2/path2": {"target": "test3"},
+    }
+    # add_target_files_to_role expects target files of a single role, sign each role once
+    roles_target_files: Dict[str, Dict] = defaultdict(dict)
+    for path, role in tuf_repo.map_signing_roles(list(target_files)).items():
+        roles_target_files[role][path] = target_files[path]
+    for role_target_files in roles_target_files.values():
+        tuf_repo.add_target_files_to_role(role_target_files)
+    return tuf_repo
 
-    tuf_repo.add_target_files_to_role(
-        {
-            delegated_path1: {"target": "test1", "custom": custom1},
-            delegated_path2: {"target": "test2", "custom": custom2},
-        }
-    )
 
-    path_delegated = "dir2/path2"
-    tuf_repo.add_target_files_to_role(
-        {
-            path_delegated: {"target": "test3"},
-        }
+@pytest.fixture(scope="module")
+def tuf_repo_with_overlapping_delegations(
+    tuf_repo_path, prebuilt_tuf_repo_with_delegations, signers_with_delegations
+):
+    # add a sibling of delegated_role whose path is also matched by delegated_role's
+    path = tuf_repo_path / "repository_with_overlapping_delegations"
+    shutil.copytree(prebuilt_tuf_repo_with_delegations, path)
+    tuf_repo = MetadataRepository(path)
+    tuf_repo.add_signers_to_cache(signers_with_delegations)
+    overlapping_role = TargetsRole(
+        name="overlapping_role",
+        parent=TargetsRole(),
+        paths=["dir1/path1"],
+        number=1,
+        threshold=1,
+        yubikey=False,
+    )
+    tuf_repo.create_delegated_roles(
+        [overlapping_role],
+        {"overlapping_role": signers_with_delegations["inner_role"]},
     )
-    yield tuf_repo
-    shutil.rmtree(path, onerror=on_rm_error)
+    return tuf_repo
@@ -85,6 +85,16 @@ def test_find_delegated_roles_parent(tuf_repo_with_delegations):
     )
 
 
+def test_find_delegated_roles_parents(tuf_repo_with_delegations):
+    assert tuf_repo_with_delegations.find_delegated_roles_parents(
+        ["inner_role", "delegated_role", "doesntexist"]
+    ) == {
+        "inner_role": "delegated_role",
+        "delegated_role": "targets",
+        "doesntexist": None,
+    }
+
+
 def test_check_if_role_exists(tuf_repo_with_delegations):
     assert tuf_repo_with_delegations.check_if_role_exists("targets")
     assert tuf_repo_with_delegations.check_if_role_exists("inner_role")
@@ -117,6 +127,15 @@ def test_signing_roles(tuf_repo_with_delegations):
     assert actual["other"] == "targets"
 
 
+def test_signing_roles_overlapping_siblings(tuf_repo_with_overlapping_delegations):
+    # of two sibling roles matching the same path, the first listed one signs it
+    actual = tuf_repo_with_overlapping_delegations.map_signing_roles(
+        ["dir1/path1", "dir1/path2"]
+    )
+    assert actual["dir1/path1"] == "delegated_role"
+    assert actual["dir1/path2"] == "delegated_role"
+
+
 def test_get_role_from_target_paths(tuf_repo_with_delegations):
     assert (
         tuf_repo_with_delegations.get_role_from_target_paths(
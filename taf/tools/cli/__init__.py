@@ -5,6 +5,7 @@ from functools import partial, wraps
 from logging import ERROR
 from logdecorator import log_on_error
 
+from taf.constants import DEFAULT_RSA_SIGNATURE_SCHEME
 from taf.exceptions import (
     InvalidRepositoryError,
     RepositoryNotCleanError,
@@ -111,48 +112,62 @@ def process_custom_command_line_args(ctx):
             return False
         return value
 
-    if len(ctx.args) % 2 == 1:
-        raise TAFError(
-            "Custom parameters invalid. Check if there are spaces around each parameter/value"
-        )
+    if not ctx.args:
+        return {}
 
-    custom = (
-        {
-            ctx.args[i][2:]: _convert_value(ctx.args[i + 1])
-            for i in range(0, len(ctx.args), 2)
-        }
-        if len(ctx.args)
-        else {}
-    )
+    invalid_message = "Custom parameters invalid. Check if there are spaces around each parameter/value"
+    if len(ctx.args) % 2 == 1:
+        raise TAFError(invalid_message)
+
+    # iterate over (--name, value) pairs
+    args = iter(ctx.args)
+    custom = {}
+    for name, value in zip(args, args):
+        if not name.startswith("--"):
+            raise TAFError(invalid_message)
+        custom[name[2:]] = _convert_value(value)
     return custom
 
 
+# options shared by multiple commands are created once and reused by all of them
+keystore_option = click.option(
+    "--keystore", default=None, help="Location of the keystore files"
+)
+no_commit_option = click.option(
+    "--no-commit",
+    is_flag=True,
+    default=False,
+    help="Indicates that the changes should not be committed automatically",
+)
+prompt_for_keys_option = click.option(
+    "--prompt-for-keys",
+    is_flag=True,
+    default=False,
+    help="Whether to ask the user to enter their key if not located inside the keystore directory",
+)
+keys_description_option = click.option(
+    "--keys-description",
+    help="A dictionary containing information about the keys or a path to a json file which stores this information",
+)
+no_remote_check_option = click.option(
+    "--no-remote-check",
+    is_flag=True,
+    help="Whether to skip the check if there are any remote changes. Can be used when the SSH key requires a passphrase",
+)
+scheme_option = click.option(
+    "--scheme",
+    default=DEFAULT_RSA_SIGNATURE_SCHEME,
+    help="A signature scheme used for signing",
+)
+
+
 def common_repo_edit_options(func):
     """
     Decorator to add common options to Click command functions.
     """
-    func = click.option(
-        "--keystore", default=None, help="Location of the keystore files"
-    )(func)
-    func = click.option(
-        "--no-commit",
-        is_flag=True,
-        default=False,
-        help="Indicates that the changes should not be committed automatically",
-    )(func)
-    func = click.option(
-        "--prompt-for-keys",
-        is_flag=True,
-        default=False,
-        help="Whether to ask the user to enter their key if not located inside the keystore directory",
-    )(func)
-    func = click.option(
-        "--keys-description",
-        help="A dictionary containing information about the keys or a path to a json file which stores this information",
-    )(func)
-    func = click.option(
-        "--no-remote-check",
-        is_flag=True,
-        help="Whether to skip the check if there are any remote changes. Can be used when the SSH key requires a passphrase",
-    )(func)
+    func = keystore_option(func)
+    func = no_commit_option(func)
+    func = prompt_for_keys_option(func)
+    func = keys_description_option(func)
+    func = no_remote_check_option(func)
     return func
@@ -22,7 +22,7 @@ class LazyGroup(click.Group):
         module_name, function_name = function.rsplit(".", 1)
         module = importlib.import_module(module_name)
         function = getattr(module, function_name)
-        group = click.Group(name=cmd_name)
+        group = LazyCommandsGroup(name=cmd_name)
         function(group)
         return group
 
@@ -33,10 +33,15 @@ class LazyGroup(click.Group):
 
         for subcommand in sorted(loaded_commands | sub_commands):
             if subcommand in self.lazy_subcommands:
-                # Load the command to get its help text
-                cmd = self._lazy_load(subcommand)
-            else:
-                cmd = self.get_command(ctx, subcommand)
+                # lazily loaded groups are created without help text, so there is
+                # no need to import the module (and all of its dependencies) just
+                # to list them - only check if the command is available
+                if not self.lazy_subcommands[subcommand]():
+                    continue
+                rows.append((subcommand, ""))
+                continue
+
+            cmd = self.get_command(ctx, subcommand)
             if cmd is None:
                 continue
 
@@ -46,3 +51,26 @@ class LazyGroup(click.Group):
         if rows:
             with formatter.section("Commands"):
                 formatter.write_dl(rows)
+
+
+class LazyCommandsGroup(click.Group):
+    """
+    A group whose commands can be registered using functions which create them.
+    A command is only created when it is needed, so executing a single command
+    does not require creating all commands of the group and their options
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = {}
+
+    def add_lazy_command(self, create_command, name):
+        self.lazy_commands[name] = create_command
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            self.add_command(self.lazy_commands[cmd_name](), name=cmd_name)
+        return super().get_command(ctx, cmd_name)
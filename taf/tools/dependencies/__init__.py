@@ -2,7 +2,7 @@ import click
 from taf.api.dependencies import add_dependency, remove_dependency
 from taf.exceptions import TAFError
 from taf.tools.cli import catch_cli_exception, common_repo_edit_options, find_repository, process_custom_command_line_args
-from taf.tools.repo import pin_managed
+from taf.yubikey.yubikey_manager import pin_managed
 
 
 def add_dependency_command():
@@ -1,10 +1,9 @@
 import click
 from pathlib import Path
 from taf.api.metadata import update_metadata_expiration_date, check_expiration_dates, add_key_names
-from taf.constants import DEFAULT_RSA_SIGNATURE_SCHEME
 from taf.exceptions import TAFError
-from taf.tools.cli import catch_cli_exception, common_repo_edit_options, find_repository
-from taf.tools.repo import pin_managed
+from taf.tools.cli import catch_cli_exception, common_repo_edit_options, find_repository, scheme_option
+from taf.yubikey.yubikey_manager import pin_managed
 from taf.utils import ISO_DATE_PARAM_TYPE as ISO_DATE
 from taf.log import taf_logger
 import datetime
@@ -81,7 +80,7 @@ def update_expiration_dates_command():
     @click.option("--path", default=".", help="Authentication repository's location. If not specified, set to the current directory")
     @click.option("--role", multiple=True, help="A list of roles which expiration date should get updated")
     @click.option("--interval", default=None, type=int, help="Number of days added to the start date")
-    @click.option("--scheme", default=DEFAULT_RSA_SIGNATURE_SCHEME, help="A signature scheme used for signing")
+    @scheme_option
     @click.option("--start-date", default=datetime.datetime.now(), type=ISO_DATE, help="Date to which the interval is added")
     @click.option("--commit-msg", default=None, help="Commit message")
     @pin_managed
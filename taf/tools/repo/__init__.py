@@ -7,9 +7,8 @@ from taf.api.repository import create_repository, taf_status
 from taf.auth_repo import AuthenticationRepository
 from taf.exceptions import TAFError, UpdateFailedError
 from taf.log import initialize_logger_handlers, taf_logger
-from taf.tools.cli import catch_cli_exception, find_repository
+from taf.tools.cli import catch_cli_exception, find_repository, keystore_option
 from taf.updater.types.update import UpdateType
-from taf.updater.updater import OperationType, UpdateConfig, clone_repository, update_repository, validate_repository
 from taf.yubikey.yubikey_manager import pin_managed
 
 
@@ -27,6 +26,8 @@ def _call_updater(config, format_output):
     """
     A helper function which calls update or clone repository
     """
+    from taf.updater.updater import OperationType, clone_repository, update_repository
+
     try:
         if config.operation == OperationType.CLONE:
             updater_output = clone_repository(config)
@@ -116,7 +117,7 @@ def create_repo_command():
     @click.argument("path", type=click.Path(exists=False, file_okay=False, dir_okay=True, writable=True))
     @click.option("--keys-description", help="A dictionary containing information about the "
                   "keys or a path to a json file which stores the needed information")
-    @click.option("--keystore", default=None, help="Location of the keystore files")
+    @keystore_option
     @click.option("--no-commit", is_flag=True, default=False, help="Indicates if the changes should be "
                   "committed automatically")
     @click.option("--test", is_flag=True, default=False, help="Indicates if the created repository "
@@ -180,6 +181,8 @@ def clone_repo_command():
     @click.option("-v", "--verbosity", count=True, help="Displays varied levels of logging information based on verbosity level")
     @click.option("--run-scripts/--no-run-scripts", default=False, help="Run the auxiliary lifecycle handler scripts.")
     def clone(path, url, library_dir, from_fs, expected_repo_type, scripts_root_dir, profile, format_output, exclude_target, strict, bare, upstream, no_deps, verbosity, run_scripts):
+        from taf.updater.updater import OperationType, UpdateConfig
+
         settings.VERBOSITY = verbosity
         initialize_logger_handlers()
         if profile:
@@ -249,6 +252,8 @@ def update_repo_command():
     @click.option("-v", "--verbosity", count=True, help="Displays varied levels of logging information based on verbosity level")
     @click.option("--run-scripts/--no-run-scripts", default=False, help="Run the auxiliary lifecycle handler scripts.")
     def update(path, library_dir, expected_repo_type, scripts_root_dir, profile, format_output, exclude_target, strict, no_deps, force, upstream, verbosity, run_scripts):
+        from taf.updater.updater import OperationType, UpdateConfig
+
         settings.VERBOSITY = verbosity
         initialize_logger_handlers()
 
@@ -300,6 +305,8 @@ def validate_repo_command():
     @click.option("-v", "--verbosity", count=True, help="Displays varied levels of logging information based on verbosity level")
     @click.option("--profile", is_flag=True, help="Flag used to run profiler and generate .prof file")
     def validate(path, library_dir, from_commit, from_latest, exclude_target, strict, no_targets, no_deps, verbosity, profile):
+        from taf.updater.updater import validate_repository
+
         settings.VERBOSITY = verbosity
         initialize_logger_handlers()
         if profile:
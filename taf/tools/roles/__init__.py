@@ -10,14 +10,13 @@ from taf.api.roles import (
     remove_paths,
     rotate_signing_key,
 )
-from taf.constants import DEFAULT_RSA_SIGNATURE_SCHEME
 from taf.exceptions import TAFError
 from taf.auth_repo import AuthenticationRepository
 from taf.log import taf_logger
-from taf.tools.cli import catch_cli_exception, common_repo_edit_options, find_repository
+from taf.tools.cli import catch_cli_exception, common_repo_edit_options, find_repository, scheme_option, keystore_option
 
 from taf.api.roles import add_role_paths
-from taf.tools.repo import pin_managed
+from taf.yubikey.yubikey_manager import pin_managed
 
 
 def add_roles_command():
@@ -73,7 +72,7 @@ def add_roles_command():
     @common_repo_edit_options
     @click.option("--config-file", type=click.Path(exists=True), help="Path to the JSON configuration file.")
     @click.option("--path", default=".", help="Authentication repository's location. If not specified, set to the current directory")
-    @click.option("--scheme", default=DEFAULT_RSA_SIGNATURE_SCHEME, help="A signature scheme used for signing")
+    @scheme_option
     @pin_managed
     def add_roles(config_file, path, scheme, keystore, no_commit, prompt_for_keys, pin_manager, keys_description, no_remote_check):
         add_multiple_roles(
@@ -98,7 +97,7 @@ def export_roles_description_command():
     @catch_cli_exception(handle=TAFError)
     @click.option("--path", default=".", help="Authentication repository's location. If not specified, set to the current directory")
     @click.option("--output", default=None, help="Output file path")
-    @click.option("--keystore", default=None, help="Location of the keystore files")
+    @keystore_option
     @pin_managed
     def export_roles_description(path, output, keystore, pin_manager):
         auth_repo = AuthenticationRepository(path=path, pin_manager=pin_manager)
@@ -158,7 +157,7 @@ def remove_role_command():
     @click.argument("role")
     @common_repo_edit_options
     @click.option("--path", default=".", help="Authentication repository's location. If not specified, set to the current directory")
-    @click.option("--scheme", default=DEFAULT_RSA_SIGNATURE_SCHEME, help="A signature scheme used for signing")
+    @scheme_option
     @click.option("--remove-targets/--no-remove-targets", default=True, help="Should targets delegated to this role also be removed. If not removed, they are signed by the parent role")
     @pin_managed
     def remove(role, path, keystore, scheme, remove_targets, no_commit, prompt_for_keys, pin_manager, keys_description, no_remote_check):
@@ -184,7 +183,7 @@ def remove_paths_command():
     @common_repo_edit_options
     @click.option("--path", default=".", help="Authentication repository's location. If not specified, set to the current directory")
     @click.option("--delegated-path", multiple=True, help="A list of paths to be removed")
-    @click.option("--scheme", default=DEFAULT_RSA_SIGNATURE_SCHEME, help="A signature scheme used for signing")
+    @scheme_option
     @click.option("--commit-msg", default=None, help="Commit message")
     @pin_managed
     def remove_delegated_paths(path, delegated_path, keystore, scheme, no_commit, prompt_for_keys, pin_manager, keys_description, no_remote_check, commit_msg):
@@ -223,7 +222,7 @@ def add_signing_key_command():
     @click.option("--path", default=".", help="Authentication repository's location. If not specified, set to the current directory")
     @click.option("--role", multiple=True, help="A list of roles to whose list of signing keys the new key should be added")
     @click.option("--pub-key-path", default=None, help="Path to the public key corresponding to the private key which should be registered as the role's signing key")
-    @click.option("--scheme", default=DEFAULT_RSA_SIGNATURE_SCHEME, help="A signature scheme used for signing")
+    @scheme_option
     @click.option("--commit-msg", default=None, help="Commit message")
     @pin_managed
     def adding_signing_key(path, role, pub_key_path, keystore, scheme, no_commit, prompt_for_keys, pin_manager, keys_description, no_remote_check, commit_msg):
@@ -257,7 +256,7 @@ def revoke_signing_key_command():
     @click.argument("keyid")
     @click.option("--path", default=".", help="Authentication repository's location. If not specified, set to the current directory")
     @click.option("--role", multiple=True, help="A list of roles from which to remove the key. If unspecified, the key is removed from all roles by default.")
-    @click.option("--scheme", default=DEFAULT_RSA_SIGNATURE_SCHEME, help="A signature scheme used for signing")
+    @scheme_option
     @click.option("--commit-msg", default=None, help="Commit message")
     @pin_managed
     def revoke_key(path, role, keyid, keystore, scheme, no_commit, prompt_for_keys, pin_manager, keys_description, no_remote_check, commit_msg):
@@ -288,7 +287,7 @@ def rotate_signing_key_command():
     @click.option("--path", default=".", help="Authentication repository's location. If not specified, set to the current directory")
     @click.option("--role", multiple=True, help="A list of roles from which to rotate the key. Rotate from all by default")
     @click.option("--pub-key-path", default=None, help="Path to the public key corresponding to the private key which should be registered as the role's signing key")
-    @click.option("--scheme", default=DEFAULT_RSA_SIGNATURE_SCHEME, help="A signature scheme used for signing")
+    @scheme_option
     @click.option("--revoke-commit-msg", default=None, help="Revoke key commit message")
     @click.option("--add-commit-msg", default=None, help="Add new signing key commit message")
     @common_repo_edit_options
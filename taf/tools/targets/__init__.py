@@ -2,21 +2,15 @@ import json
 from pathlib import Path
 import sys
 import click
-from taf.api.targets import (
-    list_targets,
-    add_target_repo,
-    register_target_files,
-    remove_target_repo,
-    export_targets_history,
-    update_and_sign_targets,
-    update_target_repos_from_repositories_json
-)
-from taf.constants import DEFAULT_RSA_SIGNATURE_SCHEME
 from taf.exceptions import TAFError
-from taf.tools.cli import catch_cli_exception, common_repo_edit_options, find_repository
+from taf.tools.cli import catch_cli_exception, common_repo_edit_options, find_repository, scheme_option, keystore_option, no_commit_option, prompt_for_keys_option, keys_description_option
 from taf.models.types import Commitish
 from taf.log import taf_logger
-from taf.tools.repo import pin_managed
+from taf.yubikey.yubikey_manager import pin_managed
+
+
+# taf.api.targets (and the TUF and git machinery it depends on) is imported inside of
+# the commands, so that it is only loaded when one of them is executed
 
 
 def add_repo_command():
@@ -65,12 +59,13 @@ def add_repo_command():
     @common_repo_edit_options
     @click.option("--path", default=".", help="Authentication repository's location. If not specified, set to the current directory")
     @click.argument("target-name")
-    @click.option("--target-path", default=None, help="Target repository's filesystem path")
+    @click.option("--target-path", default=None, type=click.Path(file_okay=False, resolve_path=True, path_type=Path), help="Target repository's filesystem path")
     @click.option("--role", default="targets", help="Signing role of the corresponding target file. Can be a new role, in which case it will be necessary to provide additional information")
     @click.option("--config-file", type=click.Path(exists=True), help="Path to the JSON configuration file containing information about the new role and/or targets custom data.")
-    @click.option("--scheme", default=DEFAULT_RSA_SIGNATURE_SCHEME, help="A signature scheme used for signing")
+    @scheme_option
     @pin_managed
     def add_repo(path, target_path, target_name, role, config_file, keystore, prompt_for_keys, scheme, no_commit, pin_manager, keys_description, no_remote_check):
+        from taf.api.targets import add_target_repo
 
         config_data = {}
         if config_file:
@@ -143,9 +138,11 @@ def export_history_command():
     @catch_cli_exception(handle=TAFError)
     @click.option("--path", default=".", help="Authentication repository's location. If not specified, set to the current directory")
     @click.option("--commit", default=None, help="Starting authentication repository commit")
-    @click.option("--output", default=None, help="File to which the resulting json will be written. If not provided, the output will be printed to console")
+    @click.option("--output", default=None, type=click.Path(dir_okay=False, resolve_path=True, path_type=Path), help="File to which the resulting json will be written. If not provided, the output will be printed to console")
     @click.option("--repo", multiple=True, help="Target repository whose historical data should be collected")
     def export_history(path, commit, output, repo):
+        from taf.api.targets import export_targets_history
+
         export_targets_history(path, Commitish.from_commit(commit), output, repo)
     return export_history
 
@@ -166,6 +163,8 @@ def list_targets_command():
     @catch_cli_exception(handle=TAFError, print_error=True)
     @click.option("--path", default=".", help="Authentication repository's location. If not specified, set to the current directory")
     def list(path):
+        from taf.api.targets import list_targets
+
         targets_status = list_targets(path)
         taf_logger.log("NOTICE", json.dumps(targets_status, indent=4))
     return list
@@ -180,6 +179,8 @@ def remove_repo_command():
     @click.argument("target-name")
     @pin_managed
     def remove_repo(path, target_name, keystore, prompt_for_keys, pin_manager, keys_description, no_remote_check):
+        from taf.api.targets import remove_target_repo
+
         remove_target_repo(
             path=path,
             pin_manager=pin_manager,
@@ -201,14 +202,16 @@ def sign_targets_command():
         by manually entering the key or by using a Yubikey.""")
     @find_repository
     @catch_cli_exception(handle=TAFError)
-    @click.option("--prompt-for-keys", is_flag=True, default=False, help="Whether to ask the user to enter their key if not located inside the keystore directory")
-    @click.option("--keys-description", help="A dictionary containing information about the keys or a path to a json file which stores this information")
-    @click.option("--keystore", default=None, help="Location of the keystore files")
+    @prompt_for_keys_option
+    @keys_description_option
+    @keystore_option
     @click.option("--path", default=".", help="Authentication repository's location. If not specified, set to the current directory")
-    @click.option("--scheme", default=DEFAULT_RSA_SIGNATURE_SCHEME, help="A signature scheme used for signing")
-    @click.option("--no-commit", is_flag=True, default=False, help="Indicates that the changes should not be committed automatically")
+    @scheme_option
+    @no_commit_option
     @pin_managed
     def sign(path, keystore, keys_description, scheme, prompt_for_keys, no_commit, pin_manager):
+        from taf.api.targets import register_target_files
+
         try:
             register_target_files(
                 path=path,
@@ -221,9 +224,7 @@ def sign_targets_command():
                 commit=not no_commit,
             )
         except TAFError as e:
-            click.echo()
-            click.echo(str(e))
-            click.echo()
+            click.echo(f"\n{e}\n")
     return sign
 
 
@@ -250,15 +251,18 @@ def update_and_sign_command():
     @find_repository
     @catch_cli_exception(handle=TAFError)
     @click.option("--path", default=".", help="Authentication repository's location. If not specified, set to the current directory")
-    @click.option("--library-dir", default=None, help="Directory where target repositories and, optionally, authentication repository are located. If omitted it is calculated based on authentication repository's path. Authentication repo is presumed to be at library-dir/namespace/auth-repo-name")
+    @click.option("--library-dir", default=None, type=click.Path(file_okay=False, resolve_path=True, path_type=Path), help="Directory where target repositories and, optionally, authentication repository are located. If omitted it is calculated based on authentication repository's path. Authentication repo is presumed to be at library-dir/namespace/auth-repo-name")
     @click.option("--target-type", multiple=True, help="Types of target repositories whose corresponding target files should be updated and signed. Should match a target type defined in repositories.json")
-    @click.option("--keystore", default=None, help="Location of the keystore files")
+    @keystore_option
     @click.option("--keys-description", help="A dictionary containing information about the keys or a path to a json file which stores the needed information")
-    @click.option("--scheme", default=DEFAULT_RSA_SIGNATURE_SCHEME, help="A signature scheme used for signing")
-    @click.option("--prompt-for-keys", is_flag=True, default=False, help="Whether to ask the user to enter their key if not located inside the keystore directory")
-    @click.option("--no-commit", is_flag=True, default=False, help="Indicates that the changes should not be committed automatically")
+    @scheme_option
+    @prompt_for_keys_option
+    @no_commit_option
+    @click.option("--jobs", type=click.IntRange(min=1), default=None, help="Number of target repositories processed in parallel. Defaults to the number of CPUs")
     @pin_managed
-    def update_and_sign(path, library_dir, target_type, keystore, keys_description, scheme, prompt_for_keys, no_commit, pin_manager):
+    def update_and_sign(path, library_dir, target_type, keystore, keys_description, scheme, prompt_for_keys, no_commit, jobs, pin_manager):
+        from taf.api.targets import update_and_sign_targets, update_target_repos_from_repositories_json
+
         try:
             if len(target_type):
                 update_and_sign_targets(
@@ -271,30 +275,30 @@ def update_and_sign_command():
                     scheme=scheme,
                     prompt_for_keys=prompt_for_keys,
                     commit=not no_commit,
+                    jobs=jobs,
                 )
             else:
                 update_target_repos_from_repositories_json(
                     path,
+                    pin_manager,
                     library_dir,
                     add_branch=True,
                     keystore=keystore,
                     scheme=scheme,
                     prompt_for_keys=prompt_for_keys,
                     commit=not no_commit,
-                    keys_description=keys_description,
+                    jobs=jobs,
                 )
         except TAFError as e:
-            click.echo()
-            click.echo(str(e))
-            click.echo()
+            click.echo(f"\n{e}\n")
     return update_and_sign
 
 
 def attach_to_group(group):
-
-    group.add_command(add_repo_command(), name='add-repo')
-    group.add_command(export_history_command(), name='export-history')
-    group.add_command(list_targets_command(), name='list')
-    group.add_command(remove_repo_command(), name='remove-repo')
-    group.add_command(sign_targets_command(), name='sign')
-    group.add_command(update_and_sign_command(), name='update-and-sign')
+    # commands are only created when they are invoked or listed
+    group.add_lazy_command(add_repo_command, name='add-repo')
+    group.add_lazy_command(export_history_command, name='export-history')
+    group.add_lazy_command(list_targets_command, name='list')
+    group.add_lazy_command(remove_repo_command, name='remove-repo')
+    group.add_lazy_command(sign_targets_command, name='sign')
+    group.add_lazy_command(update_and_sign_command, name='update-and-sign')
@@ -9,7 +9,7 @@ from taf.api.yubikey import (
 from taf.exceptions import YubikeyError
 from taf.repository_utils import find_valid_repository
 from taf.tools.cli import catch_cli_exception
-from taf.tools.repo import pin_managed
+from taf.yubikey.yubikey_manager import pin_managed
 from taf.yubikey.yubikey import list_connected_yubikeys, list_all_devices
 
 
@@ -3,6 +3,7 @@
 """
 
 
+from functools import lru_cache
 from typing import Optional, Tuple, Union
 
 from pathlib import Path
@@ -91,11 +92,16 @@ def get_sslib_key_from_value(
 def _get_legacy_keyid(key: SSlibKey) -> str:
     """Computes legacy keyid as hash over an opinionated canonical
     representation of the public key."""
+    return _compute_legacy_keyid(key.keytype, key.scheme, key.keyval["public"].strip())
+
+
+@lru_cache(maxsize=1024)
+def _compute_legacy_keyid(keytype: str, scheme: str, public: str) -> str:
     data = encode_canonical(
         {
-            "keytype": key.keytype,
-            "scheme": key.scheme,
-            "keyval": {"public": key.keyval["public"].strip()},
+            "keytype": keytype,
+            "scheme": scheme,
+            "keyval": {"public": public},
             "keyid_hash_algorithms": ["sha256", "sha512"],
         }
     ).encode("utf-8")
@@ -1,17 +1,19 @@
 """TUF metadata repository"""
 
 
-from fnmatch import fnmatch
-from functools import reduce
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import translate
+from functools import lru_cache
+from io import BytesIO, TextIOWrapper
 import json
-import operator
 import os
+import re
 from pathlib import Path
 import logging
-from collections import defaultdict
+from collections import defaultdict, deque
 from datetime import datetime, timedelta, timezone
 import shutil
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Deque, Dict, List, Optional, Pattern, Set, Tuple, Union
 from securesystemslib.exceptions import StorageError
 from cryptography.hazmat.primitives import serialization
 
@@ -25,22 +27,17 @@ from securesystemslib.storage import FilesystemBackend
 from taf.yubikey.yubikey_manager import YubiKeyStore
 from tuf.api.metadata import Signed
 
-try:
-    import taf.yubikey.yubikey as yk
-except ImportError:
-    yk = YubikeyMissingLibrary()  # type: ignore
-
 from taf.constants import DEFAULT_RSA_SIGNATURE_SCHEME
 from taf.utils import (
     default_backend,
-    get_file_details,
+    iter_relative_file_paths,
+    json_loads,
     on_rm_error,
-    normalize_file_line_endings,
+    normalize_line_endings,
 )
 from tuf.api.metadata import (
     Metadata,
     MetaFile,
-    Role,
     Root,
     Snapshot,
     Targets,
@@ -71,6 +68,27 @@ HASH_FUNCTION = "sha256"
 HASH_ALGS = ["sha256", "sha512"]
 
 
+@lru_cache(maxsize=128)
+def _load_public_key(pub_key_pem: str):
+    """
+    Load a PEM encoded public key. The same keys are usually loaded many times
+    when describing roles, so parsed keys are cached by their PEM
+    """
+    return serialization.load_pem_public_key(
+        pub_key_pem.encode(), backend=default_backend()
+    )
+
+
+@lru_cache(maxsize=1024)
+def _compile_path_pattern(path_pattern: str) -> Pattern:
+    """
+    Compile a delegated path glob pattern to a regular expression which matches
+    target paths the same way fnmatch does. Delegated paths of a repository rarely
+    change, so compiled patterns are reused across calls
+    """
+    return re.compile(translate(os.path.normcase(path_pattern.lstrip(os.sep))))
+
+
 class FakeDelegatedRole:
     """A fake role to bypass validation checks in Delegations."""
 
@@ -171,7 +189,7 @@ class MetadataRepository(Repository):
         self.path = Path(path)
 
         self._snapshot_info = MetaFile(1)
-        self._targets_infos: Dict[str, MetaFile] = defaultdict(lambda: MetaFile(1))
+        self._targets_infos: Dict[str, MetaFile] = {}
         if storage_backend:
             self.storage_backend = storage_backend
         else:
@@ -252,17 +270,7 @@ class MetadataRepository(Repository):
         Return a set of relative paths of all files inside the targets
         directory
         """
-        targets = []
-        # Assume self.targets_path is a Path object, or convert it if necessary
-        base_path = Path(self.targets_path)
-
-        for filepath in base_path.rglob("*"):
-            if filepath.is_file():
-                # Get the relative path to the base directory and convert it to a POSIX path
-                relative_path = filepath.relative_to(base_path).as_posix()
-                targets.append(relative_path)
-
-        return set(targets)
+        return set(iter_relative_file_paths(self.targets_path))
 
     def add_metadata_keys(self, roles_keys: Dict[str, List]) -> Tuple[Dict, Dict, Dict]:
         """Add signer public keys for role to root and update signer cache without updating snapshot and timestamp.
@@ -270,23 +278,23 @@ class MetadataRepository(Repository):
         Return:
             added_keys, already_added_keys, invalid_keys
         """
-        already_added_keys = defaultdict(list)
-        invalid_keys = defaultdict(list)
-        added_keys = defaultdict(list)
+        already_added_keys: Dict[str, List] = {}
+        invalid_keys: Dict[str, List] = {}
+        added_keys: Dict[str, List] = {}
 
         def _filter_if_can_be_added(roles):
-            keys_to_be_added = defaultdict(list)
+            keys_to_be_added: Dict[str, List] = {}
             for role, keys in roles_keys.items():
                 if role in roles:
                     for key in keys:
                         try:
                             if self.is_valid_metadata_key(role, key):
-                                already_added_keys[role].append(key)
+                                already_added_keys.setdefault(role, []).append(key)
                                 continue
                         except TAFError:
-                            invalid_keys[role].append(key)
+                            invalid_keys.setdefault(role, []).append(key)
                             continue
-                        keys_to_be_added[role].append(key)
+                        keys_to_be_added.setdefault(role, []).append(key)
             return keys_to_be_added
 
         parents = self.find_parents_of_roles(list(roles_keys.keys()))
@@ -300,25 +308,27 @@ class MetadataRepository(Repository):
                 for role, keys in keys_to_be_added_to_root.items():
                     for key in keys:
                         root.add_key(key, role)
-                        added_keys[role].append(key)
+                        added_keys.setdefault(role, []).append(key)
 
         other_roles = [role for role in roles_keys if role not in MAIN_ROLES]
         keys_to_be_added_to_targets = _filter_if_can_be_added(other_roles)
 
-        roles_by_parents = defaultdict(list)
+        roles_by_parents: Dict[str, List] = {}
         if keys_to_be_added_to_targets:
             # group other roles by parents
-            for role, keys in keys_to_be_added_to_targets.items():
-                parent = self.find_delegated_roles_parent(role)
-                roles_by_parents[parent].append(role)
+            roles_parents = self.find_delegated_roles_parents(
+                list(keys_to_be_added_to_targets)
+            )
+            for role, parent in roles_parents.items():
+                roles_by_parents.setdefault(parent, []).append(role)
 
             for parent, roles in roles_by_parents.items():
                 with self.edit(parent) as parent_role:
                     for role in roles:
-                        keys = roles_keys[role]
+                        keys = keys_to_be_added_to_targets[role]
                         for key in keys:
                             parent_role.add_key(key, role)
-                            added_keys[role].append(key)
+                            added_keys.setdefault(role, []).append(key)
 
         return added_keys, already_added_keys, invalid_keys
 
@@ -377,11 +387,9 @@ class MetadataRepository(Repository):
         when a new delegated role is added.
         """
         with self.edit(Snapshot.type) as sn:
-            parents_of_roles = set()
             for role in roles:
                 sn.meta[f"{role}.json"] = MetaFile(1)
-                parent_role = self.find_delegated_roles_parent(role)
-                parents_of_roles.add(parent_role)
+            parents_of_roles = set(self.find_delegated_roles_parents(roles).values())
             for parent_role in parents_of_roles:
                 sn.meta[f"{parent_role}.json"].version = (
                     sn.meta[f"{parent_role}.json"].version + 1
@@ -416,8 +424,12 @@ class MetadataRepository(Repository):
         Return:
             A dcitionary mapping algorithms and calculated hashes
         """
-        hashes = {}
         data = md.to_bytes(serializer=self.serializer)
+        return self._calculate_hashes_of_data(data, algorithms)
+
+    @staticmethod
+    def _calculate_hashes_of_data(data: bytes, algorithms: List[str]) -> Dict:
+        hashes = {}
         for algo in algorithms:
             digest_object = sslib_hash.digest(algo)
             digest_object.update(data)
@@ -481,24 +493,27 @@ class MetadataRepository(Repository):
         if excluded_roles is None:
             excluded_roles = []
 
-        target_roles = self.get_all_targets_roles()
-        main_roles = ["root", "targets", "snapshot", "timestamp"]
-        existing_roles = list(set(target_roles + main_roles) - set(excluded_roles))
+        excluded = set(excluded_roles)
+        # targets is both a main and a targets role, so remove duplicates
+        # while keeping the roles in a deterministic order
+        existing_roles = [
+            role
+            for role in dict.fromkeys(MAIN_ROLES + self.get_all_targets_roles())
+            if role not in excluded
+        ]
 
-        expired_dict = {}
-        will_expire_dict = {}
+        expired = []
+        will_expire = []
         for role in existing_roles:
             expiry_date = self.get_expiration_date(role)
             if start_date > expiry_date:
-                expired_dict[role] = expiry_date
+                expired.append((expiry_date, role))
             elif expiration_threshold >= expiry_date:
-                will_expire_dict[role] = expiry_date
-        # sort by expiry date
-        expired_dict = {
-            k: v for k, v in sorted(expired_dict.items(), key=lambda item: item[1])
-        }
+                will_expire.append((expiry_date, role))
+        # sort by expiry date, roles which expire at the same time by name
+        expired_dict = {role: expiry_date for expiry_date, role in sorted(expired)}
         will_expire_dict = {
-            k: v for k, v in sorted(will_expire_dict.items(), key=lambda item: item[1])
+            role: expiry_date for expiry_date, role in sorted(will_expire)
         }
 
         return expired_dict, will_expire_dict
@@ -526,11 +541,10 @@ class MetadataRepository(Repository):
             if not target_path.is_file():
                 target_path.touch()
         else:
-            with open(str(target_path), "w") as f:
-                if isinstance(content, dict):
-                    json.dump(content, f, indent=4)
-                else:
-                    f.write(content)
+            # serialize json content at once instead of writing it in chunks
+            if isinstance(content, dict):
+                content = json.dumps(content, indent=4)
+            target_path.write_text(content)
 
     def clear_open_metadata(self) -> None:
         """
@@ -555,25 +569,25 @@ class MetadataRepository(Repository):
         # `do_snapshot` and `do_timestamp`
         if role == "snapshot":
             self._snapshot_info.version = md.signed.version
-            self._snapshot_info.hashes = self.calculate_hashes(md, HASH_ALGS)
-            self._snapshot_info.length = self.calculate_length(md)
+            snapshot_data = md.to_bytes(serializer=self.serializer)
+            self._snapshot_info.hashes = self._calculate_hashes_of_data(
+                snapshot_data, HASH_ALGS
+            )
+            self._snapshot_info.length = len(snapshot_data)
             root_version = self.signed_obj("root").version
             md.signed.meta["root.json"].version = root_version
 
         elif role != "timestamp":  # role in [root, targets, <delegated targets>]
-            self._targets_infos[fname].version = md.signed.version
+            self._targets_infos[fname] = MetaFile(md.signed.version)
 
         # Write role metadata to disk (root gets a version-prefixed copy)
-        md.to_file(
-            self.metadata_path / fname,
-            serializer=self.serializer,
-            storage_backend=self.storage_backend,
-        )
+        # Serialize it only once and write the same bytes to both files
+        data = md.to_bytes(serializer=self.serializer)
+        self.storage_backend.put(BytesIO(data), str(self.metadata_path / fname))
 
         if role == "root":
-            md.to_file(
-                self.metadata_path / f"{md.signed.version}.{fname}",
-                serializer=self.serializer,
+            FilesystemBackend().put(
+                BytesIO(data), str(self.metadata_path / f"{md.signed.version}.{fname}")
             )
 
     def create(
@@ -791,21 +805,30 @@ class MetadataRepository(Repository):
         if not data:
             raise TargetsError("Nothing to be modified!")
 
+        # resolve the targets directory once, instead of once for every target path
+        targets_path = self.targets_path.absolute()
         added_paths = []
         for path, target_data in added_data.items():
-            target_path = (self.targets_path / path).absolute()
+            target_path = targets_path / path
             self._create_target_file(target_path, target_data)
             added_paths.append(target_path)
 
         # remove existing target files
         removed_paths = []
         for path in removed_data.keys():
-            target_path = (self.targets_path / path).absolute()
-            if target_path.exists():
-                if target_path.is_file():
-                    target_path.unlink()
-                elif target_path.is_dir():
-                    shutil.rmtree(target_path, onerror=on_rm_error)
+            target_path = targets_path / path
+            # try to remove the path as a file first and only check what it is
+            # if that fails, instead of calling stat before every removal
+            try:
+                target_path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError:
+                # depending on the platform, unlinking a directory raises
+                # IsADirectoryError or PermissionError
+                if not target_path.is_dir():
+                    raise
+                shutil.rmtree(target_path, onerror=on_rm_error)
             removed_paths.append(str(path))
 
         return added_paths, removed_paths
@@ -819,8 +842,13 @@ class MetadataRepository(Repository):
         before adding a target objects due to hashes getting calculated differently when using CRLF vs LF line endings.
         So we instead convert all to unix style endings.
         """
-        normalize_file_line_endings(filesystem_path)
-        data = Path(filesystem_path).read_text().encode()
+        # read the file only once, both to normalize its line endings and to hash it
+        content = Path(filesystem_path).read_bytes()
+        normalized_content = normalize_line_endings(content)
+        if normalized_content != content:
+            Path(filesystem_path).write_bytes(normalized_content)
+        # decode the content the same way read_text does
+        data = TextIOWrapper(BytesIO(normalized_content)).read().encode()
         target_file = TargetFile.from_data(
             target_file_path=target_path,
             data=data,
@@ -831,6 +859,24 @@ class MetadataRepository(Repository):
             target_file.unrecognized_fields = unrecognized_fields
         return target_file
 
+    def _create_target_objects(
+        self, targets: List[Tuple[Path, str, Optional[Dict]]]
+    ) -> List[TargetFile]:
+        """
+        Creates TUF target objects of multiple target files, given as tuples of their
+        filesystem path, target path and custom data. Files are independent of each
+        other, so they are read and hashed in parallel
+        """
+        if not targets:
+            return []
+        max_workers = min(len(targets), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda target: self._create_target_object(*target), targets
+                )
+            )
+
     def delete_unregistered_target_files(self, targets_role="targets"):
         """
         Delete all target files not specified in targets.json
@@ -849,29 +895,41 @@ class MetadataRepository(Repository):
         """
         Find parent role of the specified delegated targets role
         """
+        return self.find_delegated_roles_parents([delegated_role])[delegated_role]
+
+    def find_delegated_roles_parents(
+        self, delegated_roles: List[str]
+    ) -> Dict[str, Optional[str]]:
+        """
+        Find parent roles of all of the specified delegated targets roles by traversing
+        the delegations tree once. The traversal stops as soon as all parents are found.
+        Parents of roles which are not delegated are set to None.
+        """
+        roles_parents: Dict[str, Optional[str]] = dict.fromkeys(delegated_roles)
+        roles_to_find = set(delegated_roles)
         parents = ["targets"]
 
-        while parents:
+        while parents and roles_to_find:
             parent = parents.pop()
             for delegation in self.get_delegations_of_role(parent):
-                if delegation == delegated_role:
-                    return parent
+                if delegation in roles_to_find:
+                    roles_parents[delegation] = parent
+                    roles_to_find.discard(delegation)
                 parents.append(delegation)
-        return None
+        return roles_parents
 
     def find_parents_of_roles(self, roles: List[str]):
         """
         Find parents of all roles contained by the specified list of roles.
         """
         parents = set()
-        for role in roles:
-            if role in MAIN_ROLES:
-                parents.add("root")
-            else:
-                parent = self.find_delegated_roles_parent(role)
-                if parent is None:
-                    raise TAFError(f"Could not determine parent of role {role}")
-                parents.add(parent)
+        delegated_roles = [role for role in roles if role not in MAIN_ROLES]
+        if len(delegated_roles) < len(roles):
+            parents.add("root")
+        for role, parent in self.find_delegated_roles_parents(delegated_roles).items():
+            if parent is None:
+                raise TAFError(f"Could not determine parent of role {role}")
+            parents.add(parent)
         return parents
 
     def find_role_containing_key_of_role(self, role_name: str) -> Optional[str]:
@@ -1033,19 +1091,46 @@ class MetadataRepository(Repository):
         fs_target_files = self.all_target_files()
         # current signed state
         signed_target_files = self.get_signed_target_files()
+        # look up signed target file objects of all files found on the file system
+        # at once, instead of searching for the signing role of each file separately
+        fs_signed_target_files = self._get_signed_target_files(list(fs_target_files))
+
+        signed_hashes: Dict[str, Optional[str]] = {}
+        for file_name, target_obj in fs_signed_target_files.items():
+            if target_obj is not None and HASH_FUNCTION not in target_obj.hashes:
+                raise TAFError(f"Invalid hashing algorithm {HASH_FUNCTION}")
+            signed_hashes[file_name] = (
+                target_obj.hashes[HASH_FUNCTION] if target_obj is not None else None
+            )
+
+        def _read_if_changed(file_name: str) -> Optional[str]:
+            # read each file only once, both to calculate its hash and to get
+            # the content of new or changed files
+            data = (self.targets_path / file_name).read_bytes()
+            file_hash = self._calculate_hashes_of_data(data, [HASH_FUNCTION])[
+                HASH_FUNCTION
+            ]
+            if file_hash == signed_hashes[file_name]:
+                return None
+            # decode the content the same way read_text does
+            return TextIOWrapper(BytesIO(data)).read()
+
+        # files are read and hashed in parallel, while the results are collected
+        # in the calling thread, in the order in which the files were listed
+        file_names = sorted(fs_target_files)
+        max_workers = min(len(file_names), os.cpu_count() or 1) or 1
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            contents = list(executor.map(_read_if_changed, file_names))
 
         # existing files with custom data and (modified) content
-        for file_name in fs_target_files:
-            target_file = self.targets_path / file_name
-            _, hashes = get_file_details(str(target_file))
+        for file_name, content in zip(file_names, contents):
             # register only new or changed files
-            if hashes.get(HASH_FUNCTION) != self.get_target_file_hashes(file_name):
-                custom = self.get_target_file_custom_data(file_name)
-                added_target_files[file_name] = {
-                    "target": target_file.read_text(),
-                }
-                if custom:
-                    added_target_files[file_name]["custom"] = custom
+            if content is None:
+                continue
+            added_target_files[file_name] = {"target": content}
+            target_obj = fs_signed_target_files[file_name]
+            if target_obj is not None and target_obj.custom:
+                added_target_files[file_name]["custom"] = target_obj.custom
 
         # removed files
         for file_name in signed_target_files - fs_target_files:
@@ -1111,21 +1196,23 @@ class MetadataRepository(Repository):
         NOTE: Currently each target has only one mapped role.
         """
         targets_roles = self.map_signing_roles(target_paths)
-        roles = list(targets_roles.values())
 
-        try:
-            # all target files should have at least one common role
-            common_role = reduce(
-                set.intersection,
-                [set([r]) if isinstance(r, str) else set(r) for r in roles],
+        # all target files should have at least one common role
+        common_roles: Optional[Set[str]] = None
+        for target_roles in targets_roles.values():
+            roles = (
+                {target_roles} if isinstance(target_roles, str) else set(target_roles)
             )
-        except TypeError:
-            return None
+            common_roles = roles if common_roles is None else common_roles & roles
+            # stop as soon as there are no common roles left
+            if not common_roles:
+                return None
 
-        if not common_role:
+        # no target paths were given
+        if common_roles is None:
             return None
 
-        return common_role.pop()
+        return common_roles.pop()
 
     def get_signable_metadata(self, role: str):
         """Return signable portion of newly generate metadata for given role.
@@ -1168,13 +1255,10 @@ class MetadataRepository(Repository):
         if roles is None:
             roles = self.get_all_targets_roles()
 
-        return set(
-            reduce(
-                operator.iconcat,
-                [self.signed_obj(role).targets.keys() for role in roles],
-                [],
-            )
-        )
+        signed_target_files: Set[str] = set()
+        for role in roles:
+            signed_target_files.update(self.signed_obj(role).targets.keys())
+        return signed_target_files
 
     def get_signed_targets_with_custom_data(
         self, roles: Optional[List[str]] = None
@@ -1203,15 +1287,31 @@ class MetadataRepository(Repository):
             pass
         return target_files
 
+    def _get_signed_target_files(
+        self, target_paths: List[str]
+    ) -> Dict[str, Optional[TargetFile]]:
+        """
+        Return signed target file objects of the specified target paths, read from
+        metadata of the roles responsible for signing them, or None if a path is not signed.
+        Roles of all paths are determined at once and metadata of each of those roles
+        is only loaded once.
+        """
+        paths_roles = self.map_signing_roles(target_paths)
+        roles_targets: Dict[str, Dict[str, TargetFile]] = {}
+        signed_target_files = {}
+        for target_path in target_paths:
+            role = paths_roles[target_path]
+            if role not in roles_targets:
+                roles_targets[role] = self.get_targets_of_role(role)
+            signed_target_files[target_path] = roles_targets[role].get(target_path)
+        return signed_target_files
+
     def get_target_file_custom_data(self, target_path: str) -> Optional[Dict]:
         """
         Return a custom data of a given target.
         """
         try:
-            role = self.get_role_from_target_paths([target_path])
-            if role is None:
-                return None
-            target_obj = self.get_targets_of_role(role).get(target_path)
+            target_obj = self._get_signed_target_files([target_path])[target_path]
             if target_obj:
                 return target_obj.custom
             return None
@@ -1228,13 +1328,10 @@ class MetadataRepository(Repository):
         - TAFError if the target does not exist
         """
         try:
-            role = self.get_role_from_target_paths([target_path])
-            if role is None:
-                return None
-            targets_of_role = self.get_targets_of_role(role)
-            if target_path not in targets_of_role:
+            target_obj = self._get_signed_target_files([target_path])[target_path]
+            if target_obj is None:
                 return None
-            hashes = targets_of_role[target_path].hashes
+            hashes = target_obj.hashes
             if hash_func not in hashes:
                 raise TAFError(f"Invalid hashing algorithm {hash_func}")
             return hashes[hash_func]
@@ -1249,19 +1346,17 @@ class MetadataRepository(Repository):
         This data is specified in metadata files (root or a target role that has delegations)
         """
         try:
-            metadata = json.loads(
+            metadata = json_loads(
                 Path(
                     self.path, METADATA_DIRECTORY_NAME, f"{parent_role}.json"
-                ).read_text()
+                ).read_bytes()
             )
             metadata = metadata["signed"]
             if "delegations" in metadata:
                 metadata = metadata["delegations"]
             scheme = metadata["keys"][keyid]["scheme"]
             pub_key_pem = metadata["keys"][keyid]["keyval"]["public"]
-            pub_key = serialization.load_pem_public_key(
-                pub_key_pem.encode(), backend=default_backend()
-            )
+            pub_key = _load_public_key(pub_key_pem)
             return pub_key, pub_key_pem, scheme
         except Exception:
             return None, None, None
@@ -1271,10 +1366,10 @@ class MetadataRepository(Repository):
         Return key names from metadata files of a parent role (root or a target role that has delegations)
         """
         try:
-            metadata = json.loads(
+            metadata = json_loads(
                 Path(
                     self.path, METADATA_DIRECTORY_NAME, f"{parent_role}.json"
-                ).read_text()
+                ).read_bytes()
             )
             metadata = metadata["signed"]
             if "delegations" in metadata:
@@ -1321,44 +1416,44 @@ class MetadataRepository(Repository):
         """
         roles_description = {}
 
-        def _get_delegations(role_name):
+        def _get_delegations(delegations):
             delegations_info = {}
-            for delegation in self.get_delegations_of_role(role_name):
-                delegated_role = self._role_obj(delegation)
+            # roles and keys of delegated roles are read from the parent's metadata
+            # which is already loaded, instead of reading it again for each of them
+            for delegation, delegated_role in (delegations.roles or {}).items():
                 delegations_info[delegation] = {
                     "threshold": delegated_role.threshold,
                     "number": len(delegated_role.keyids),
                     "paths": delegated_role.paths,
                     "terminating": delegated_role.terminating,
                 }
-                pub_key, _, scheme = self.get_key_length_and_scheme_from_metadata(
-                    role_name, delegated_role.keyids[0]
-                )
+                key = delegations.keys[delegated_role.keyids[0]]
+                pub_key = _load_public_key(key.keyval["public"])
 
-                delegations_info[delegation]["scheme"] = scheme
+                delegations_info[delegation]["scheme"] = key.scheme
                 delegations_info[delegation]["length"] = pub_key.key_size
                 delegated_signed = self.signed_obj(delegation)
                 if delegated_signed.delegations:
-                    inner_roles_data = _get_delegations(delegation)
+                    inner_roles_data = _get_delegations(delegated_signed.delegations)
                     if len(inner_roles_data):
                         delegations_info[delegation]["delegations"] = inner_roles_data
             return delegations_info
 
+        root_signed = self.signed_obj("root")
         for role_name in MAIN_ROLES:
-            role_obj = self._role_obj(role_name)
+            role_obj = root_signed.roles[role_name]
             roles_description[role_name] = {
                 "threshold": role_obj.threshold,
                 "number": len(role_obj.keyids),
             }
-            pub_key, _, scheme = self.get_key_length_and_scheme_from_metadata(
-                "root", role_obj.keyids[0]
-            )
-            roles_description[role_name]["scheme"] = scheme
+            key = root_signed.keys[role_obj.keyids[0]]
+            pub_key = _load_public_key(key.keyval["public"])
+            roles_description[role_name]["scheme"] = key.scheme
             roles_description[role_name]["length"] = pub_key.key_size
             if role_name == "targets":
                 targets_signed = self.signed_obj(role_name)
                 if targets_signed.delegations:
-                    delegations_info = _get_delegations(role_name)
+                    delegations_info = _get_delegations(targets_signed.delegations)
                     if len(delegations_info):
                         roles_description[role_name]["delegations"] = delegations_info
         return {"roles": roles_description}
@@ -1425,6 +1520,11 @@ class MetadataRepository(Repository):
         """
 
         if public_key is None:
+            # yubikey-manager is only needed (and imported) when reading a YubiKey
+            try:
+                import taf.yubikey.yubikey as yk
+            except ImportError:
+                yk = YubikeyMissingLibrary()  # type: ignore
             public_key = yk.get_piv_public_key_tuf()
 
         return self.is_valid_metadata_key(role, public_key)
@@ -1461,23 +1561,44 @@ class MetadataRepository(Repository):
         pattern.
         """
 
-        roles = ["targets"]
         roles_targets = {
             target_filename: "targets" for target_filename in target_filenames
         }
+        # nesting depth of the role currently mapped to each target
+        targets_depths = dict.fromkeys(target_filenames, 0)
+        # normalize the target paths once, the same way fnmatch would on each call
+        normalized_filenames = [
+            (target_filename, os.path.normcase(target_filename.lstrip(os.sep)))
+            for target_filename in target_filenames
+        ]
+        # paths of delegated roles are read from their parent's delegations while
+        # traversing the tree, instead of searching for each role's parent
+        # roles are visited breadth first, so less specific roles are processed
+        # before the more deeply nested ones
+        roles: Deque[Tuple[str, List[str], int]] = deque(
+            (name, delegated_role.paths or [], 1)
+            for name, delegated_role in self.get_delegations_of_role("targets").items()
+        )
+        visited = {"targets"}
+        visited.update(name for name, _, _ in roles)
         while roles:
-            role = roles.pop()
-            path_patterns = self.get_role_paths(role)
+            role, path_patterns, depth = roles.popleft()
             for path_pattern in path_patterns:
-                for target_filename in target_filenames:
-                    if fnmatch(
-                        target_filename.lstrip(os.sep),
-                        path_pattern.lstrip(os.sep),
+                # compile each pattern once and match all target paths against it
+                match = _compile_path_pattern(path_pattern).match
+                for target_filename, normalized_filename in normalized_filenames:
+                    # the most deeply nested role wins, while of sibling roles
+                    # at the same depth the first listed one keeps the target
+                    if depth > targets_depths[target_filename] and match(
+                        normalized_filename
                     ):
                         roles_targets[target_filename] = role
+                        targets_depths[target_filename] = depth
 
-            for delegation in self.get_delegations_of_role(role):
-                roles.append(delegation)
+            for name, delegated_role in self.get_delegations_of_role(role).items():
+                if name not in visited:
+                    visited.add(name)
+                    roles.append((name, delegated_role.paths or [], depth + 1))
 
         return roles_targets
 
@@ -1528,12 +1649,13 @@ class MetadataRepository(Repository):
             )
         _, removed_paths = self.create_and_remove_target_files(added_data, removed_data)
 
-        target_files = []
-        for path, target_data in added_data.items():
-            target_path = (self.targets_path / path).absolute()
-            custom = target_data.get("custom", None)
-            target_file = self._create_target_object(target_path, path, custom)
-            target_files.append(target_file)
+        targets_path = self.targets_path.absolute()
+        target_files = self._create_target_objects(
+            [
+                (targets_path / path, path, target_data.get("custom", None))
+                for path, target_data in added_data.items()
+            ]
+        )
 
         targets_role = self._modify_targets_role(
             target_files, removed_paths, targets_role
@@ -1597,20 +1719,30 @@ class MetadataRepository(Repository):
         if not roles:
             raise TAFError("Key not used to sign any role")
 
-        parents = self.find_parents_of_roles(roles)
-        self.verify_signers_loaded(parents)
+        # find parents of all delegated roles at once and reuse them when reading
+        # the roles and editing their parents
+        delegated_roles_parents = self.find_delegated_roles_parents(
+            [role for role in roles if role not in MAIN_ROLES]
+        )
+        parents = set()
+        if len(delegated_roles_parents) < len(roles):
+            parents.add("root")
+        for role, parent in delegated_roles_parents.items():
+            if parent is None:
+                raise TAFError(f"Could not determine parent of role {role}")
+            parents.add(parent)
+        self.verify_signers_loaded(list(parents))
 
         removed_from_roles = []
         not_added_roles = []
         less_than_threshold_roles = []
 
         def _check_if_can_remove(key_id, role):
-            role_obj = self._role_obj(role)
+            role_obj = self._role_obj(role, delegated_roles_parents.get(role))
             if len(role_obj.keyids) - 1 < role_obj.threshold:
                 less_than_threshold_roles.append(role)
                 return False
-            key_ids_of_role = self.get_keyids_of_role(role) or []
-            if key_id not in key_ids_of_role:
+            if key_id not in role_obj.keyids:
                 not_added_roles.append(role)
                 return False
             return True
@@ -1634,8 +1766,7 @@ class MetadataRepository(Repository):
         ]
         if len(delegated_roles):
             for role in delegated_roles:
-                parent = self.find_delegated_roles_parent(role)
-                roles_by_parents[parent].append(role)
+                roles_by_parents[delegated_roles_parents[role]].append(role)
 
             for parent, roles_of_parent in roles_by_parents.items():
                 with self.edit(parent) as parent_role:
@@ -1685,35 +1816,34 @@ class MetadataRepository(Repository):
           to the provided target_filenames list delegated to the role
         """
         targets_roles_mapping = self.map_signing_roles(target_filenames)
-        roles_targets_mapping = {}
+        roles_targets_mapping: Dict[str, List[str]] = defaultdict(list)
         for target_filename, role_name in targets_roles_mapping.items():
-            roles_targets_mapping.setdefault(role_name, []).append(target_filename)
-        return roles_targets_mapping
+            roles_targets_mapping[role_name].append(target_filename)
+        return dict(roles_targets_mapping)
 
     def _role_obj(self, role: str, parent: Optional[str] = None):
         """
         Return TUF's role object for the specified role
         """
+        # metadata loaded by open is already deserialized into TUF's objects, and a
+        # new instance is created on every call, so the role objects can be returned
+        # directly instead of converting them to dictionaries and back
         if role in MAIN_ROLES:
             md = self.open("root")
             try:
-                data = md.to_dict()["signed"]["roles"][role]
-                return Role.from_dict(data)
-            except (KeyError, ValueError):
+                return md.signed.roles[role]
+            except (AttributeError, KeyError):
                 raise TAFError("root.json is invalid")
         else:
-            parent_name = self.find_delegated_roles_parent(role)
+            # only search the delegations tree if the parent is not known
+            parent_name = parent or self.find_delegated_roles_parent(role)
             if parent_name is None:
                 return None
             md = self.open(parent_name)
-            delegations_data = md.to_dict()["signed"]["delegations"]["roles"]
-            for delegation in delegations_data:
-                if delegation["name"] == role:
-                    try:
-                        return DelegatedRole.from_dict(delegation)
-                    except (KeyError, ValueError):
-                        raise TAFError(f"{delegation}.json is invalid")
-            return None
+            delegations = getattr(md.signed, "delegations", None)
+            if delegations is None or delegations.roles is None:
+                return None
+            return delegations.roles.get(role)
 
     def signed_obj(self, role: str):
         """
@@ -1725,18 +1855,16 @@ class MetadataRepository(Repository):
     def _signed_obj(self, role: str, md=None):
         if md is None:
             md = self.open(role)
-        try:
-            signed_data = md.to_dict()["signed"]
-            role_to_role_class = {
-                "root": Root,
-                "targets": Targets,
-                "snapshot": Snapshot,
-                "timestamp": Timestamp,
-            }
-            role_class = role_to_role_class.get(role, Targets)
-            return role_class.from_dict(signed_data)
-        except (KeyError, ValueError):
+        role_to_role_class = {
+            "root": Root,
+            "targets": Targets,
+            "snapshot": Snapshot,
+            "timestamp": Timestamp,
+        }
+        role_class = role_to_role_class.get(role, Targets)
+        if not isinstance(md.signed, role_class):
             raise TAFError(f"Invalid metadata file {role}.json")
+        return md.signed
 
     def _set_default_expiration_date(self, signed: Signed) -> None:
         """
@@ -1760,7 +1888,6 @@ class MetadataRepository(Repository):
         - start_date(datetime): Date to which the specified interval is added when calculating
                                 expiration date. If a value is not provided, it is set to the
                                 current time.
-        - signers(List[CryptoSigner]): a list of signers
         - interval(int): A number of days added to the start date.
                         If not provided, the default value is set based on the role:
 
@@ -1779,8 +1906,12 @@ class MetadataRepository(Repository):
                                                         this targets object.
         """
         self.verify_signers_loaded([role_name])
-        with self.edit(role_name) as role:
+        if start_date is None:
             start_date = datetime.now(timezone.utc)
+        else:
+            # naive dates are in local time, while TUF would treat them as UTC
+            start_date = start_date.astimezone(timezone.utc)
+        with self.edit(role_name) as role:
             if interval is None:
                 try:
                     interval = self.expiration_intervals[role_name]
@@ -1793,19 +1924,8 @@ class MetadataRepository(Repository):
         """
         Group target files per target roles
         """
-        rel_paths = []
-        for filepath in self.targets_path.rglob("*"):
-            if filepath.is_file():
-                file_rel_path = str(
-                    Path(filepath).relative_to(self.targets_path).as_posix()
-                )
-                rel_paths.append(file_rel_path)
-
-        files_to_roles = self.map_signing_roles(rel_paths)
-        roles_targets = {}
-        for target_file, role in files_to_roles.items():
-            roles_targets.setdefault(role, []).append(target_file)
-        return roles_targets
+        rel_paths = list(iter_relative_file_paths(self.targets_path))
+        return self.roles_targets_for_filenames(rel_paths)
 
     def set_key_names(self, new_key_names):
         parent_roles_keys = defaultdict(list)
@@ -1847,20 +1967,22 @@ class MetadataRepository(Repository):
             raise TAFError(f"Role {role} does not exist")
         self.verify_signers_loaded([role])
         removed_paths = []
-        target_files = []
+        targets = []
         if target_paths:
+            # load the role's signed targets once and reuse them for all paths
+            targets_of_role = self.get_targets_of_role(role)
+            targets_path = self.targets_path
             for target_path in target_paths:
-                full_path = self.path / TARGETS_DIRECTORY_NAME / target_path
+                full_path = targets_path / target_path
                 # file removed, removed from te role
                 if not full_path.is_file():
                     removed_paths.append(target_path)
                 else:
-                    custom_data = self.get_target_file_custom_data(target_path)
-                    target_file = self._create_target_object(
-                        full_path, target_path, custom_data
-                    )
-                    target_files.append(target_file)
+                    target_obj = targets_of_role.get(target_path)
+                    custom_data = target_obj.custom if target_obj else None
+                    targets.append((full_path, target_path, custom_data))
 
+            target_files = self._create_target_objects(targets)
             self._modify_targets_role(target_files, removed_paths, role)
         elif force:
             with self.edit(role) as _:
@@ -1,5 +1,6 @@
 import platform
 import click
+import copy
 import errno
 import datetime
 import time
@@ -12,7 +13,7 @@ import shutil
 import uuid
 import sys
 from getpass import getpass
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
@@ -24,10 +25,15 @@ from json import JSONDecoder
 from taf.log import taf_logger
 import taf.settings
 from taf.exceptions import PINMissmatchError
-from typing import List, Optional, Tuple, Dict
+from typing import Iterator, List, Optional, Tuple, Dict, Union
 from securesystemslib.hash import digest_fileobject
 from securesystemslib.storage import FilesystemBackend, StorageBackendInterface
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 
 def _iso_parse(date):
     return datetime.datetime.strptime(date, "%Y-%m-%d %H:%M:%S.%f")
@@ -148,12 +154,11 @@ def read_input_dict(value):
         return {}
     if not isinstance(value, dict):
         if Path(value).is_file():
-            with open(value) as f:
-                try:
-                    value = json.loads(f.read())
-                except json.decoder.JSONDecodeError:
-                    print(f"\nWARNING: {value} is not a valid json!\n")
-                    return {}
+            try:
+                value = read_json_file(value)
+            except json.decoder.JSONDecodeError:
+                print(f"\nWARNING: {value} is not a valid json!\n")
+                return {}
 
         else:
             try:
@@ -165,6 +170,43 @@ def read_input_dict(value):
     return value
 
 
+def json_loads(content: Union[str, bytes]):
+    """
+    Parse json content using orjson if it is installed, as it is considerably
+    faster than the standard library's json module. Files are still written using
+    json, so that their formatting does not change.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def read_json_file(path: Union[Path, str]) -> Dict:
+    """
+    Read and parse a json file. Parsed content is cached until the file's modification
+    time or size changes, so input files like keys description are only parsed once
+    even if they are read by multiple functions. The modification time is not precise
+    enough to detect quick rewrites of the same size, so this should not be used for
+    files which are modified while the process is running, like repositories.json.
+    Callers are free to modify the returned dictionary.
+    """
+    file_stat = Path(path).stat()
+    return copy.deepcopy(
+        _load_json_file(
+            str(Path(path).resolve()), file_stat.st_mtime_ns, file_stat.st_size
+        )
+    )
+
+
+@lru_cache(maxsize=32)
+def _load_json_file(path: str, mtime_ns: int, size: int) -> Dict:
+    """
+    Load a json file, e.g. keys description. Modification time and size are
+    only a part of the cache key, so that a modified file is loaded again.
+    """
+    return json_loads(Path(path).read_bytes())
+
+
 def run(*command, **kwargs):
     """Run a command and return its output. Call with `debug=True` to print to
     stdout.
@@ -278,6 +320,29 @@ def run_subprocess(command):
         raise e
 
 
+def iter_relative_file_paths(
+    base_dir: Union[Path, str], prefix: str = ""
+) -> Iterator[str]:
+    """
+    Yield paths of all files inside the specified directory and its subdirectories,
+    relative to that directory and joined using forward slashes. File types are
+    read from the directory entries returned by os.scandir, so no additional stat
+    calls or path parsing are needed per file. Like Path.rglob, symbolic links to
+    directories are not followed and directories which cannot be read are skipped.
+    """
+    try:
+        with os.scandir(base_dir) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from iter_relative_file_paths(
+                        entry.path, f"{prefix}{entry.name}/"
+                    )
+                elif entry.is_file():
+                    yield f"{prefix}{entry.name}"
+    except (FileNotFoundError, PermissionError):
+        return
+
+
 def normalize_file_line_endings(file_path):
     with open(file_path, "rb") as open_file:
         content = open_file.read()
@@ -315,6 +380,19 @@ def on_rm_error(_func, path, _exc_info):
         pass
 
 
+def remove_directory(path: Union[str, Path]) -> None:
+    """Remove a directory and all of its content, e.g. a git repository.
+    Git makes its object files read-only, which only prevents their removal on
+    Windows. There, make all files writable in one pass before removing them,
+    instead of handling a failed removal of every single file in on_rm_error.
+    """
+    if os.name == "nt":
+        for root, _, files in os.walk(path):
+            for file_name in files:
+                os.chmod(Path(root, file_name), stat.S_IWRITE)
+    shutil.rmtree(path, onerror=on_rm_error)
+
+
 def safely_save_json_to_disk(data, permanent_path):
     tfile = tempfile.NamedTemporaryFile(mode="w+t", delete=False)
     if data is not None:
@@ -5,7 +5,7 @@ from contextlib import contextmanager
 from functools import wraps
 from getpass import getpass
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional
 
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
@@ -45,6 +45,10 @@ DEFAULT_PIN = "123456"
 DEFAULT_PUK = "12345678"
 EXPIRATION_INTERVAL = 36500
 
+# public keys (PEM) read from inserted YubiKeys, keyed by serial numbers
+# a YubiKey's key can only change if the YubiKey is set up again
+_public_keys_pems: Dict = {}
+
 
 def raise_yubikey_err(msg: Optional[str] = None) -> Callable:
     """Decorator used to catch all errors raised by yubikey-manager and raise
@@ -373,7 +377,11 @@ def get_piv_public_key_tuf(
         - YubikeyError
     """
     taf_logger.debug(f"Extracting TUF-format public key from serial={serial}")
-    pub_key_pem = export_piv_pub_key(serial=serial).decode("utf-8")
+    pub_key_pem = _public_keys_pems.get(serial) if serial is not None else None
+    if pub_key_pem is None:
+        pub_key_pem = export_piv_pub_key(serial=serial).decode("utf-8")
+        if serial is not None:
+            _public_keys_pems[serial] = pub_key_pem
     return get_sslib_key_from_value(pub_key_pem, scheme)
 
 
@@ -649,6 +657,11 @@ def setup(
     taf_logger.debug(
         f"Initializing YubiKey setup for serial={serial}, key_size={key_size}, cert_cn='{cert_cn}'"
     )
+    # the YubiKey's key is replaced, so its previously read public key is invalid
+    if serial is None:
+        _public_keys_pems.clear()
+    else:
+        _public_keys_pems.pop(serial, None)
     with _yk_piv_ctrl(serial=serial) as [(ctrl, _)]:
         taf_logger.debug(f"Resetting YubiKey to factory settings for serial={serial}")
         ctrl.reset()